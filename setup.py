@@ -33,7 +33,6 @@ VECTORS_DEPENDENCY = "cryptography_vectors=={0}".format(about['__version__'])
 
 requirements = [
     "idna>=2.0",
-    "pyasn1",
     "six>=1.4.1",
     "setuptools"
 ]
@@ -77,6 +77,7 @@ ffi = build_ffi_for_binding(
         "err",
         "evp",
         "hmac",
+        "locking",
         "nid",
         "objects",
         "opensslv",
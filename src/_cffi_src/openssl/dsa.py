@@ -43,6 +43,8 @@ int DSA_sign(int, const unsigned char *, int, unsigned char *, unsigned int *,
              DSA *);
 int DSA_verify(int, const unsigned char *, int, const unsigned char *, int,
                DSA *);
+DSA_SIG *DSA_do_sign(const unsigned char *, int, DSA *);
+int DSA_do_verify(const unsigned char *, int, DSA_SIG *, DSA *);
 """
 
 MACROS = """
@@ -0,0 +1,81 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+INCLUDES = """
+#include <openssl/crypto.h>
+#if !defined(_WIN32)
+#include <pthread.h>
+#endif
+#include <stdlib.h>
+"""
+
+TYPES = """
+"""
+
+FUNCTIONS = """
+int Cryptography_setup_ssl_threads(void);
+"""
+
+MACROS = """
+"""
+
+CUSTOMIZATIONS = """
+/* OpenSSL calls the locking callback for every CRYPTO_lock. Implementing
+   it in C means taking one of OpenSSL's locks doesn't need the GIL.
+   Returns 1 if the callback was installed and 0 if it is not available on
+   this platform or the locks could not be allocated. */
+#if defined(_WIN32)
+int Cryptography_setup_ssl_threads(void) {
+    return 0;
+}
+#else
+static pthread_mutex_t *Cryptography_ssl_locks = NULL;
+static int Cryptography_ssl_locks_count = 0;
+
+static void Cryptography_ssl_locking_function(int mode, int n,
+                                              const char *file, int line) {
+    if (n < 0 || n >= Cryptography_ssl_locks_count) {
+        return;
+    }
+
+    if (mode & CRYPTO_LOCK) {
+        pthread_mutex_lock(&Cryptography_ssl_locks[n]);
+    } else {
+        pthread_mutex_unlock(&Cryptography_ssl_locks[n]);
+    }
+}
+
+int Cryptography_setup_ssl_threads(void) {
+    int i;
+    int count;
+
+    if (Cryptography_ssl_locks == NULL) {
+        count = CRYPTO_num_locks();
+        Cryptography_ssl_locks = calloc(count, sizeof(pthread_mutex_t));
+        if (Cryptography_ssl_locks == NULL) {
+            return 0;
+        }
+
+        for (i = 0; i < count; i++) {
+            if (pthread_mutex_init(&Cryptography_ssl_locks[i], NULL) != 0) {
+                while (--i >= 0) {
+                    pthread_mutex_destroy(&Cryptography_ssl_locks[i]);
+                }
+                free(Cryptography_ssl_locks);
+                Cryptography_ssl_locks = NULL;
+                return 0;
+            }
+        }
+        Cryptography_ssl_locks_count = count;
+    }
+
+    CRYPTO_set_locking_callback(Cryptography_ssl_locking_function);
+    return 1;
+}
+#endif
+"""
+
+CONDITIONAL_NAMES = {}
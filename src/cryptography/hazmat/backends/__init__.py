@@ -4,7 +4,7 @@
 
 from __future__ import absolute_import, division, print_function
 
-import pkg_resources
+import os
 
 from cryptography.hazmat.backends.multibackend import MultiBackend
 
@@ -16,6 +16,10 @@ def _available_backends():
     global _available_backends_list
 
     if _available_backends_list is None:
+        # pkg_resources is slow to import and resolving the entry points
+        # initializes every backend, so both wait until a backend is needed.
+        import pkg_resources
+
         _available_backends_list = [
             # setuptools 11.3 deprecated support for the require parameter to
             # load(), and introduced the new resolve() method instead.
@@ -30,6 +34,33 @@ def _available_backends():
 
     return _available_backends_list
 
+# The backends that ship with cryptography can be loaded without looking up
+# their entry points.
+_builtin_backends = {
+    "openssl": "cryptography.hazmat.backends.openssl",
+    "commoncrypto": "cryptography.hazmat.backends.commoncrypto",
+}
+
+
+def _load_backend(name):
+    if name in _builtin_backends:
+        try:
+            module = __import__(_builtin_backends[name], fromlist=["backend"])
+        except ImportError:
+            raise ValueError(
+                "CRYPTOGRAPHY_BACKEND names a backend that is not available "
+                "on this system: {0}.".format(name)
+            )
+        return module.backend
+
+    for backend in _available_backends():
+        if backend.name == name:
+            return backend
+
+    raise ValueError(
+        "CRYPTOGRAPHY_BACKEND names an unknown backend: {0}.".format(name)
+    )
+
 _default_backend = None
 
 
@@ -37,6 +68,14 @@ def default_backend():
     global _default_backend
 
     if _default_backend is None:
-        _default_backend = MultiBackend(_available_backends())
+        name = os.environ.get("CRYPTOGRAPHY_BACKEND")
+        if name:
+            _default_backend = _load_backend(name)
+        else:
+            backends = _available_backends()
+            if len(backends) == 1:
+                _default_backend = backends[0]
+            else:
+                _default_backend = MultiBackend(backends)
 
     return _default_backend
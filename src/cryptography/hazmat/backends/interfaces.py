@@ -197,6 +197,12 @@ class EllipticCurveBackend(object):
         Returns True if the backend supports the named elliptic curve.
         """
 
+    @abc.abstractmethod
+    def elliptic_curve_exchange_algorithm_supported(self, algorithm, curve):
+        """
+        Returns whether the exchange algorithm is supported by this backend.
+        """
+
     @abc.abstractmethod
     def generate_elliptic_curve_private_key(self, curve):
         """
@@ -13,6 +13,9 @@ from cryptography.hazmat.backends.interfaces import (
 )
 
 
+_UNSUPPORTED = object()
+
+
 @utils.register_interface(CMACBackend)
 @utils.register_interface(CipherBackend)
 @utils.register_interface(DERSerializationBackend)
@@ -29,12 +32,53 @@ class MultiBackend(object):
 
     def __init__(self, backends):
         self._backends = backends
+        self._routes = {}
 
     def _filtered_backends(self, interface):
         for b in self._backends:
             if isinstance(b, interface):
                 yield b
 
+    def _route(self, route, interface, call):
+        """
+        Returns call(backend) for the first backend providing interface that
+        doesn't raise UnsupportedAlgorithm, or _UNSUPPORTED if there is none.
+
+        The backend that succeeds is remembered for route and tried first the
+        next time. A route is the operation name plus every property of its
+        arguments that backends decide support on, such as the algorithm
+        types and the cipher key size, so the remembered backend is always
+        the one the ordered search would have found. If it raises
+        UnsupportedAlgorithm anyway the other backends are tried in order.
+        """
+        backend = self._routes.get(route)
+        if backend is not None:
+            try:
+                return call(backend)
+            except UnsupportedAlgorithm:
+                pass
+
+        for b in self._filtered_backends(interface):
+            if b is backend:
+                continue
+
+            try:
+                result = call(b)
+            except UnsupportedAlgorithm:
+                continue
+
+            self._routes[route] = b
+            return result
+
+        return _UNSUPPORTED
+
+    @property
+    def routes(self):
+        return dict(self._routes)
+
+    def clear_routes(self):
+        self._routes.clear()
+
     def cipher_supported(self, cipher, mode):
         return any(
             b.cipher_supported(cipher, mode)
@@ -42,11 +86,16 @@ class MultiBackend(object):
         )
 
     def create_symmetric_encryption_ctx(self, cipher, mode):
-        for b in self._filtered_backends(CipherBackend):
-            try:
-                return b.create_symmetric_encryption_ctx(cipher, mode)
-            except UnsupportedAlgorithm:
-                pass
+        ctx = self._route(
+            (
+                "create_symmetric_encryption_ctx",
+                type(cipher), cipher.key_size, type(mode)
+            ),
+            CipherBackend,
+            lambda b: b.create_symmetric_encryption_ctx(cipher, mode)
+        )
+        if ctx is not _UNSUPPORTED:
+            return ctx
         raise UnsupportedAlgorithm(
             "cipher {0} in {1} mode is not supported by this backend.".format(
                 cipher.name, mode.name if mode else mode),
@@ -54,11 +103,16 @@ class MultiBackend(object):
         )
 
     def create_symmetric_decryption_ctx(self, cipher, mode):
-        for b in self._filtered_backends(CipherBackend):
-            try:
-                return b.create_symmetric_decryption_ctx(cipher, mode)
-            except UnsupportedAlgorithm:
-                pass
+        ctx = self._route(
+            (
+                "create_symmetric_decryption_ctx",
+                type(cipher), cipher.key_size, type(mode)
+            ),
+            CipherBackend,
+            lambda b: b.create_symmetric_decryption_ctx(cipher, mode)
+        )
+        if ctx is not _UNSUPPORTED:
+            return ctx
         raise UnsupportedAlgorithm(
             "cipher {0} in {1} mode is not supported by this backend.".format(
                 cipher.name, mode.name if mode else mode),
@@ -72,11 +126,13 @@ class MultiBackend(object):
         )
 
     def create_hash_ctx(self, algorithm):
-        for b in self._filtered_backends(HashBackend):
-            try:
-                return b.create_hash_ctx(algorithm)
-            except UnsupportedAlgorithm:
-                pass
+        ctx = self._route(
+            ("create_hash_ctx", type(algorithm)),
+            HashBackend,
+            lambda b: b.create_hash_ctx(algorithm)
+        )
+        if ctx is not _UNSUPPORTED:
+            return ctx
         raise UnsupportedAlgorithm(
             "{0} is not a supported hash on this backend.".format(
                 algorithm.name),
@@ -90,11 +146,13 @@ class MultiBackend(object):
         )
 
     def create_hmac_ctx(self, key, algorithm):
-        for b in self._filtered_backends(HMACBackend):
-            try:
-                return b.create_hmac_ctx(key, algorithm)
-            except UnsupportedAlgorithm:
-                pass
+        ctx = self._route(
+            ("create_hmac_ctx", type(algorithm)),
+            HMACBackend,
+            lambda b: b.create_hmac_ctx(key, algorithm)
+        )
+        if ctx is not _UNSUPPORTED:
+            return ctx
         raise UnsupportedAlgorithm(
             "{0} is not a supported hash on this backend.".format(
                 algorithm.name),
@@ -109,13 +167,15 @@ class MultiBackend(object):
 
     def derive_pbkdf2_hmac(self, algorithm, length, salt, iterations,
                            key_material):
-        for b in self._filtered_backends(PBKDF2HMACBackend):
-            try:
-                return b.derive_pbkdf2_hmac(
-                    algorithm, length, salt, iterations, key_material
-                )
-            except UnsupportedAlgorithm:
-                pass
+        key = self._route(
+            ("derive_pbkdf2_hmac", type(algorithm)),
+            PBKDF2HMACBackend,
+            lambda b: b.derive_pbkdf2_hmac(
+                algorithm, length, salt, iterations, key_material
+            )
+        )
+        if key is not _UNSUPPORTED:
+            return key
         raise UnsupportedAlgorithm(
             "{0} is not a supported hash on this backend.".format(
                 algorithm.name),
@@ -211,11 +271,13 @@ class MultiBackend(object):
         )
 
     def create_cmac_ctx(self, algorithm):
-        for b in self._filtered_backends(CMACBackend):
-            try:
-                return b.create_cmac_ctx(algorithm)
-            except UnsupportedAlgorithm:
-                pass
+        ctx = self._route(
+            ("create_cmac_ctx", type(algorithm), algorithm.key_size),
+            CMACBackend,
+            lambda b: b.create_cmac_ctx(algorithm)
+        )
+        if ctx is not _UNSUPPORTED:
+            return ctx
         raise UnsupportedAlgorithm("This backend does not support CMAC.",
                                    _Reasons.UNSUPPORTED_CIPHER)
 
@@ -235,12 +297,20 @@ class MultiBackend(object):
             for b in self._filtered_backends(EllipticCurveBackend)
         )
 
+    def elliptic_curve_exchange_algorithm_supported(self, algorithm, curve):
+        return any(
+            b.elliptic_curve_exchange_algorithm_supported(algorithm, curve)
+            for b in self._filtered_backends(EllipticCurveBackend)
+        )
+
     def generate_elliptic_curve_private_key(self, curve):
-        for b in self._filtered_backends(EllipticCurveBackend):
-            try:
-                return b.generate_elliptic_curve_private_key(curve)
-            except UnsupportedAlgorithm:
-                continue
+        key = self._route(
+            ("generate_elliptic_curve_private_key", type(curve)),
+            EllipticCurveBackend,
+            lambda b: b.generate_elliptic_curve_private_key(curve)
+        )
+        if key is not _UNSUPPORTED:
+            return key
 
         raise UnsupportedAlgorithm(
             "This backend does not support this elliptic curve.",
@@ -248,11 +318,16 @@ class MultiBackend(object):
         )
 
     def load_elliptic_curve_private_numbers(self, numbers):
-        for b in self._filtered_backends(EllipticCurveBackend):
-            try:
-                return b.load_elliptic_curve_private_numbers(numbers)
-            except UnsupportedAlgorithm:
-                continue
+        key = self._route(
+            (
+                "load_elliptic_curve_private_numbers",
+                type(numbers.public_numbers.curve)
+            ),
+            EllipticCurveBackend,
+            lambda b: b.load_elliptic_curve_private_numbers(numbers)
+        )
+        if key is not _UNSUPPORTED:
+            return key
 
         raise UnsupportedAlgorithm(
             "This backend does not support this elliptic curve.",
@@ -260,11 +335,13 @@ class MultiBackend(object):
         )
 
     def load_elliptic_curve_public_numbers(self, numbers):
-        for b in self._filtered_backends(EllipticCurveBackend):
-            try:
-                return b.load_elliptic_curve_public_numbers(numbers)
-            except UnsupportedAlgorithm:
-                continue
+        key = self._route(
+            ("load_elliptic_curve_public_numbers", type(numbers.curve)),
+            EllipticCurveBackend,
+            lambda b: b.load_elliptic_curve_public_numbers(numbers)
+        )
+        if key is not _UNSUPPORTED:
+            return key
 
         raise UnsupportedAlgorithm(
             "This backend does not support this elliptic curve.",
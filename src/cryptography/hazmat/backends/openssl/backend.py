@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function
 
 import collections
 import itertools
+import threading
 from contextlib import contextmanager
 
 import six
@@ -55,6 +56,10 @@ _MemoryBIO = collections.namedtuple("_MemoryBIO", ["bio", "char_ptr"])
 _OpenSSLError = collections.namedtuple("_OpenSSLError",
                                        ["code", "lib", "func", "reason"])
 
+# Enough for one BN_CTX per thread in a busy thread pool without holding on to
+# an unbounded number of them.
+_MAX_POOLED_BN_CTX = 16
+
 
 @utils.register_interface(CipherBackend)
 @utils.register_interface(CMACBackend)
@@ -91,6 +96,21 @@ class Backend(object):
         self._register_default_ciphers()
         self.activate_osrandom_engine()
 
+        # BN_CTXs are returned here after use by _tmp_bn_ctx so hot paths
+        # don't allocate a new one each time. list.pop and list.append are
+        # atomic, so no lock is needed.
+        self._bn_ctx_pool = []
+        # Maps a curve NID to the bit length of the curve's order.
+        self._ec_order_bits = {}
+        # Maps a curve NID to an EC_GROUP with a precomputed generator table.
+        self._ec_precomputed_groups = {}
+        self._ec_precompute_lock = threading.Lock()
+        self._ec_precompute_threshold = None
+        # The EC validation policy is per thread and only changed for the
+        # duration of an ec_validation_policy() block, so one caller can't
+        # weaken the checks done for everyone else sharing this backend.
+        self._ec_validate = threading.local()
+
     def activate_builtin_random(self):
         # Obtain a new structural reference.
         e = self._lib.ENGINE_get_default_RAND()
@@ -982,6 +1002,40 @@ class Backend(object):
 
         return self.elliptic_curve_supported(curve)
 
+    def set_ec_precompute_policy(self, threshold=None):
+        if threshold is not None:
+            if not isinstance(threshold, six.integer_types):
+                raise TypeError("threshold must be an integer type or None.")
+
+            if threshold < 1:
+                raise ValueError("threshold must be at least 1.")
+
+        self._ec_precompute_threshold = threshold
+
+    @contextmanager
+    def ec_validation_policy(self, validate):
+        if validate not in ("always", "untrusted-only"):
+            raise ValueError(
+                "validate must be either 'always' or 'untrusted-only'."
+            )
+
+        previous = self._ec_validation_policy()
+        self._ec_validate.policy = validate
+        try:
+            yield
+        finally:
+            self._ec_validate.policy = previous
+
+    def _ec_validation_policy(self):
+        return getattr(self._ec_validate, "policy", "always")
+
+    def elliptic_curve_exchange_algorithm_supported(self, algorithm, curve):
+        return (
+            isinstance(algorithm, ec.ECDH) and
+            self._lib.Cryptography_HAS_ECDH == 1 and
+            self.elliptic_curve_supported(curve)
+        )
+
     def generate_elliptic_curve_private_key(self, curve):
         """
         Generate a new private key on the named curve.
@@ -997,8 +1051,9 @@ class Backend(object):
             res = self._lib.EC_KEY_generate_key(ec_cdata)
             assert res == 1
 
-            res = self._lib.EC_KEY_check_key(ec_cdata)
-            assert res == 1
+            if self._ec_validation_policy() == "always":
+                res = self._lib.EC_KEY_check_key(ec_cdata)
+                assert res == 1
 
             return _EllipticCurvePrivateKey(self, ec_cdata)
         else:
@@ -1016,8 +1071,12 @@ class Backend(object):
         assert ec_cdata != self._ffi.NULL
         ec_cdata = self._ffi.gc(ec_cdata, self._lib.EC_KEY_free)
 
+        # Private numbers come from the key's owner, so under the
+        # "untrusted-only" policy only the cheap on-curve check is done.
         ec_cdata = self._ec_key_set_public_key_affine_coordinates(
-            ec_cdata, public.x, public.y)
+            ec_cdata, public.x, public.y,
+            check_key=self._ec_validation_policy() == "always"
+        )
 
         res = self._lib.EC_KEY_set_private_key(
             ec_cdata, self._int_to_bn(numbers.private_value))
@@ -1059,14 +1118,20 @@ class Backend(object):
 
     @contextmanager
     def _tmp_bn_ctx(self):
-        bn_ctx = self._lib.BN_CTX_new()
-        assert bn_ctx != self._ffi.NULL
-        bn_ctx = self._ffi.gc(bn_ctx, self._lib.BN_CTX_free)
+        try:
+            bn_ctx = self._bn_ctx_pool.pop()
+        except IndexError:
+            bn_ctx = self._lib.BN_CTX_new()
+            assert bn_ctx != self._ffi.NULL
+            bn_ctx = self._ffi.gc(bn_ctx, self._lib.BN_CTX_free)
+
         self._lib.BN_CTX_start(bn_ctx)
         try:
             yield bn_ctx
         finally:
             self._lib.BN_CTX_end(bn_ctx)
+            if len(self._bn_ctx_pool) < _MAX_POOLED_BN_CTX:
+                self._bn_ctx_pool.append(bn_ctx)
 
     def _ec_key_determine_group_get_set_funcs(self, ctx):
         """
@@ -1098,13 +1163,15 @@ class Backend(object):
 
         return set_func, get_func, group
 
-    def _ec_key_set_public_key_affine_coordinates(self, ctx, x, y):
+    def _ec_key_set_public_key_affine_coordinates(self, ctx, x, y,
+                                                  check_key=True):
         """
         This is a port of EC_KEY_set_public_key_affine_coordinates that was
         added in 1.0.1.
 
         Sets the public key point in the EC_KEY context to the affine x and y
-        values.
+        values. If check_key is False only the point is checked to be on the
+        curve, skipping EC_KEY_check_key's scalar multiplications.
         """
 
         if x < 0 or y < 0:
@@ -1138,9 +1205,18 @@ class Backend(object):
             res = self._lib.BN_cmp(bn_y, check_y)
             assert res == 0
 
+            if not check_key:
+                res = self._lib.EC_POINT_is_on_curve(group, point, bn_ctx)
+                if res != 1:
+                    self._consume_errors()
+                    raise ValueError("Invalid EC key.")
+
         res = self._lib.EC_KEY_set_public_key(ctx, point)
         assert res == 1
 
+        if not check_key:
+            return ctx
+
         res = self._lib.EC_KEY_check_key(ctx)
         if res != 1:
             self._consume_errors()
@@ -16,16 +16,20 @@ from cryptography.hazmat.primitives.ciphers.modes import CBC
 @utils.register_interface(interfaces.MACContext)
 class _CMACContext(object):
     def __init__(self, backend, algorithm, ctx=None):
-        if not backend.cmac_algorithm_supported(algorithm):
-            raise UnsupportedAlgorithm("This backend does not support CMAC.",
-                                       _Reasons.UNSUPPORTED_CIPHER)
-
         self._backend = backend
         self._key = algorithm.key
         self._algorithm = algorithm
         self._output_length = algorithm.block_size // 8
 
         if ctx is None:
+            # Copies are made from an already initialised context so only
+            # new contexts need to check for support.
+            if not backend.cmac_algorithm_supported(algorithm):
+                raise UnsupportedAlgorithm(
+                    "This backend does not support CMAC.",
+                    _Reasons.UNSUPPORTED_CIPHER
+                )
+
             registry = self._backend._cipher_registry
             adapter = registry[type(algorithm), CBC]
 
@@ -63,6 +67,7 @@ class _CMACContext(object):
 
     def copy(self):
         copied_ctx = self._backend._lib.CMAC_CTX_new()
+        assert copied_ctx != self._backend._ffi.NULL
         copied_ctx = self._backend._ffi.gc(
             copied_ctx, self._backend._lib.CMAC_CTX_free
         )
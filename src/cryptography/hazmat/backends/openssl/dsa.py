@@ -6,11 +6,14 @@ from __future__ import absolute_import, division, print_function
 
 from cryptography import utils
 from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.backends.openssl.utils import _truncate_digest
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.backends.openssl.utils import (
+    _hash_ctx_for, _raw_signature, _set_raw_signature, _truncate_digest
+)
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import (
     AsymmetricSignatureContext, AsymmetricVerificationContext, dsa
 )
+from cryptography.hazmat.primitives.asymmetric.utils import SignatureFormat
 
 
 def _truncate_digest_for_dsa(dsa_cdata, digest, backend):
@@ -26,15 +29,30 @@ def _truncate_digest_for_dsa(dsa_cdata, digest, backend):
     return _truncate_digest(digest, order_bits)
 
 
+def _unwrap_signature_algorithm(signature_algorithm):
+    if isinstance(signature_algorithm, dsa.DSA):
+        return (
+            signature_algorithm.algorithm, signature_algorithm.signature_format
+        )
+
+    return signature_algorithm, SignatureFormat.DER
+
+
+def _dsa_raw_width(backend, dsa_cdata):
+    return (backend._lib.BN_num_bits(dsa_cdata.q) + 7) // 8
+
+
 @utils.register_interface(AsymmetricVerificationContext)
 class _DSAVerificationContext(object):
-    def __init__(self, backend, public_key, signature, algorithm):
+    def __init__(self, backend, public_key, signature, algorithm,
+                 signature_format=SignatureFormat.DER):
         self._backend = backend
         self._public_key = public_key
         self._signature = signature
-        self._algorithm = algorithm
-
-        self._hash_ctx = hashes.Hash(self._algorithm, self._backend)
+        self._signature_format = signature_format
+        self._algorithm, self._hash_ctx = _hash_ctx_for(
+            algorithm, self._backend
+        )
 
     def update(self, data):
         self._hash_ctx.update(data)
@@ -46,11 +64,26 @@ class _DSAVerificationContext(object):
             self._public_key._dsa_cdata, data_to_verify, self._backend
         )
 
-        # The first parameter passed to DSA_verify is unused by OpenSSL but
-        # must be an integer.
-        res = self._backend._lib.DSA_verify(
-            0, data_to_verify, len(data_to_verify), self._signature,
-            len(self._signature), self._public_key._dsa_cdata)
+        dsa_cdata = self._public_key._dsa_cdata
+        if self._signature_format is SignatureFormat.RAW:
+            sig = self._backend._lib.DSA_SIG_new()
+            assert sig != self._backend._ffi.NULL
+            sig = self._backend._ffi.gc(sig, self._backend._lib.DSA_SIG_free)
+            if not _set_raw_signature(
+                self._backend, sig, self._signature,
+                _dsa_raw_width(self._backend, dsa_cdata)
+            ):
+                raise InvalidSignature
+
+            res = self._backend._lib.DSA_do_verify(
+                data_to_verify, len(data_to_verify), sig, dsa_cdata
+            )
+        else:
+            # The first parameter passed to DSA_verify is unused by OpenSSL
+            # but must be an integer.
+            res = self._backend._lib.DSA_verify(
+                0, data_to_verify, len(data_to_verify), self._signature,
+                len(self._signature), dsa_cdata)
 
         if res != 1:
             self._backend._consume_errors()
@@ -59,11 +92,14 @@ class _DSAVerificationContext(object):
 
 @utils.register_interface(AsymmetricSignatureContext)
 class _DSASignatureContext(object):
-    def __init__(self, backend, private_key, algorithm):
+    def __init__(self, backend, private_key, algorithm,
+                 signature_format=SignatureFormat.DER):
         self._backend = backend
         self._private_key = private_key
-        self._algorithm = algorithm
-        self._hash_ctx = hashes.Hash(self._algorithm, self._backend)
+        self._signature_format = signature_format
+        self._algorithm, self._hash_ctx = _hash_ctx_for(
+            algorithm, self._backend
+        )
 
     def update(self, data):
         self._hash_ctx.update(data)
@@ -73,6 +109,18 @@ class _DSASignatureContext(object):
         data_to_sign = _truncate_digest_for_dsa(
             self._private_key._dsa_cdata, data_to_sign, self._backend
         )
+        if self._signature_format is SignatureFormat.RAW:
+            dsa_cdata = self._private_key._dsa_cdata
+            sig = self._backend._lib.DSA_do_sign(
+                data_to_sign, len(data_to_sign), dsa_cdata
+            )
+            assert sig != self._backend._ffi.NULL
+            sig = self._backend._ffi.gc(sig, self._backend._lib.DSA_SIG_free)
+            return _raw_signature(
+                self._backend, sig.r, sig.s,
+                _dsa_raw_width(self._backend, dsa_cdata)
+            )
+
         sig_buf_len = self._backend._lib.DSA_size(self._private_key._dsa_cdata)
         sig_buf = self._backend._ffi.new("unsigned char[]", sig_buf_len)
         buflen = self._backend._ffi.new("unsigned int *")
@@ -115,7 +163,12 @@ class _DSAPrivateKey(object):
     key_size = utils.read_only_property("_key_size")
 
     def signer(self, signature_algorithm):
-        return _DSASignatureContext(self._backend, self, signature_algorithm)
+        algorithm, signature_format = _unwrap_signature_algorithm(
+            signature_algorithm
+        )
+        return _DSASignatureContext(
+            self._backend, self, algorithm, signature_format
+        )
 
     def private_numbers(self):
         return dsa.DSAPrivateNumbers(
@@ -180,8 +233,11 @@ class _DSAPublicKey(object):
     key_size = utils.read_only_property("_key_size")
 
     def verifier(self, signature, signature_algorithm):
+        algorithm, signature_format = _unwrap_signature_algorithm(
+            signature_algorithm
+        )
         return _DSAVerificationContext(
-            self._backend, self, signature, signature_algorithm
+            self._backend, self, signature, algorithm, signature_format
         )
 
     def public_numbers(self):
@@ -8,25 +8,33 @@ from cryptography import utils
 from cryptography.exceptions import (
     InvalidSignature, UnsupportedAlgorithm, _Reasons
 )
-from cryptography.hazmat.backends.openssl.utils import _truncate_digest
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.backends.openssl.utils import (
+    _hash_ctx_for, _raw_signature, _set_raw_signature, _truncate_digest
+)
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import (
     AsymmetricSignatureContext, AsymmetricVerificationContext, ec
 )
+from cryptography.hazmat.primitives.asymmetric.utils import SignatureFormat
 
 
-def _truncate_digest_for_ecdsa(ec_key_cdata, digest, backend):
+def _ec_key_order_bits(backend, ec_key_cdata):
     """
-    This function truncates digests that are longer than a given elliptic
-    curve key's length so they can be signed. Since elliptic curve keys are
-    much shorter than RSA keys many digests (e.g. SHA-512) may require
-    truncation.
+    Returns the bit length of the order of an elliptic curve key's group.
+    This is needed to truncate digests for ECDSA and only depends on the
+    curve, so it is computed once per curve and cached on the backend.
     """
 
     _lib = backend._lib
     _ffi = backend._ffi
 
     group = _lib.EC_KEY_get0_group(ec_key_cdata)
+    assert group != _ffi.NULL
+
+    nid = _lib.EC_GROUP_get_curve_name(group)
+    order_bits = backend._ec_order_bits.get(nid)
+    if order_bits is not None:
+        return order_bits
 
     with backend._tmp_bn_ctx() as bn_ctx:
         order = _lib.BN_CTX_get(bn_ctx)
@@ -37,14 +45,84 @@ def _truncate_digest_for_ecdsa(ec_key_cdata, digest, backend):
 
         order_bits = _lib.BN_num_bits(order)
 
-    return _truncate_digest(digest, order_bits)
+    if nid != _lib.NID_undef:
+        backend._ec_order_bits[nid] = order_bits
 
+    return order_bits
 
-def _ec_key_curve_sn(backend, ec_key):
+
+def _ec_key_curve_nid(backend, ec_key):
     group = backend._lib.EC_KEY_get0_group(ec_key)
     assert group != backend._ffi.NULL
 
-    nid = backend._lib.EC_GROUP_get_curve_name(group)
+    return backend._lib.EC_GROUP_get_curve_name(group)
+
+
+def _ec_precomputed_group(backend, nid):
+    """
+    Returns an EC_GROUP for the named curve holding a precomputed table of
+    multiples of its generator. The table only depends on the curve, so it
+    is built once per curve and shared by every key that uses it.
+    """
+
+    group = backend._ec_precomputed_groups.get(nid)
+    if group is not None:
+        return group
+
+    with backend._ec_precompute_lock:
+        group = backend._ec_precomputed_groups.get(nid)
+        if group is None:
+            group = backend._lib.EC_GROUP_new_by_curve_name(nid)
+            assert group != backend._ffi.NULL
+            group = backend._ffi.gc(group, backend._lib.EC_GROUP_free)
+
+            with backend._tmp_bn_ctx() as bn_ctx:
+                res = backend._lib.EC_GROUP_precompute_mult(group, bn_ctx)
+                assert res == 1
+
+            backend._ec_precomputed_groups[nid] = group
+
+    return group
+
+
+def _ec_key_precompute(backend, key):
+    if key._precomputed:
+        return
+
+    group = _ec_precomputed_group(backend, key._curve_nid)
+
+    # EC_KEY_set_group only takes a reference to the group's table. The key
+    # may be in use on other threads, so it gets a copy of its EC_KEY with
+    # the new group instead of having the current one changed under them.
+    ec_key = backend._lib.EC_KEY_dup(key._ec_key)
+    assert ec_key != backend._ffi.NULL
+    ec_key = backend._ffi.gc(ec_key, backend._lib.EC_KEY_free)
+
+    res = backend._lib.EC_KEY_set_group(ec_key, group)
+    assert res == 1
+    _mark_asn1_named_ec_curve(backend, ec_key)
+
+    key._ec_key = ec_key
+    key._precomputed = True
+
+
+def _ec_key_record_use(backend, key):
+    if key._precomputed:
+        return
+
+    if key._curve_nid in backend._ec_precomputed_groups:
+        _ec_key_precompute(backend, key)
+        return
+
+    threshold = backend._ec_precompute_threshold
+    if threshold is not None:
+        key._uses += 1
+        if key._uses >= threshold:
+            _ec_key_precompute(backend, key)
+
+
+def _ec_key_curve_sn(backend, ec_key):
+    nid = _ec_key_curve_nid(backend, ec_key)
     # The following check is to find EC keys with unnamed curves and raise
     # an error for now.
     if nid == backend._lib.NID_undef:
@@ -84,20 +162,34 @@ def _sn_to_elliptic_curve(backend, sn):
 
 @utils.register_interface(AsymmetricSignatureContext)
 class _ECDSASignatureContext(object):
-    def __init__(self, backend, private_key, algorithm):
+    def __init__(self, backend, private_key, algorithm,
+                 signature_format=SignatureFormat.DER):
         self._backend = backend
         self._private_key = private_key
-        self._digest = hashes.Hash(algorithm, backend)
+        self._signature_format = signature_format
+        _, self._digest = _hash_ctx_for(algorithm, backend)
 
     def update(self, data):
         self._digest.update(data)
 
     def finalize(self):
+        _ec_key_record_use(self._backend, self._private_key)
         ec_key = self._private_key._ec_key
 
-        digest = self._digest.finalize()
+        # Since elliptic curve keys are much shorter than RSA keys many
+        # digests (e.g. SHA-512) may need truncating before they are signed.
+        digest = _truncate_digest(
+            self._digest.finalize(), self._private_key._order_bits
+        )
 
-        digest = _truncate_digest_for_ecdsa(ec_key, digest, self._backend)
+        if self._signature_format is SignatureFormat.RAW:
+            sig = self._backend._lib.ECDSA_do_sign(digest, len(digest), ec_key)
+            assert sig != self._backend._ffi.NULL
+            sig = self._backend._ffi.gc(sig, self._backend._lib.ECDSA_SIG_free)
+            return _raw_signature(
+                self._backend, sig.r, sig.s,
+                (self._private_key._order_bits + 7) // 8
+            )
 
         max_size = self._backend._lib.ECDSA_size(ec_key)
         assert max_size > 0
@@ -118,30 +210,48 @@ class _ECDSASignatureContext(object):
 
 @utils.register_interface(AsymmetricVerificationContext)
 class _ECDSAVerificationContext(object):
-    def __init__(self, backend, public_key, signature, algorithm):
+    def __init__(self, backend, public_key, signature, algorithm,
+                 signature_format=SignatureFormat.DER):
         self._backend = backend
         self._public_key = public_key
         self._signature = signature
-        self._digest = hashes.Hash(algorithm, backend)
+        self._signature_format = signature_format
+        _, self._digest = _hash_ctx_for(algorithm, backend)
 
     def update(self, data):
         self._digest.update(data)
 
     def verify(self):
+        _ec_key_record_use(self._backend, self._public_key)
         ec_key = self._public_key._ec_key
 
-        digest = self._digest.finalize()
+        digest = _truncate_digest(
+            self._digest.finalize(), self._public_key._order_bits
+        )
 
-        digest = _truncate_digest_for_ecdsa(ec_key, digest, self._backend)
+        if self._signature_format is SignatureFormat.RAW:
+            sig = self._backend._lib.ECDSA_SIG_new()
+            assert sig != self._backend._ffi.NULL
+            sig = self._backend._ffi.gc(sig, self._backend._lib.ECDSA_SIG_free)
+            if not _set_raw_signature(
+                self._backend, sig, self._signature,
+                (self._public_key._order_bits + 7) // 8
+            ):
+                raise InvalidSignature
+
+            res = self._backend._lib.ECDSA_do_verify(
+                digest, len(digest), sig, ec_key
+            )
+        else:
+            res = self._backend._lib.ECDSA_verify(
+                0,
+                digest,
+                len(digest),
+                self._signature,
+                len(self._signature),
+                ec_key
+            )
 
-        res = self._backend._lib.ECDSA_verify(
-            0,
-            digest,
-            len(digest),
-            self._signature,
-            len(self._signature),
-            ec_key
-        )
         if res != 1:
             self._backend._consume_errors()
             raise InvalidSignature
@@ -157,19 +267,60 @@ class _EllipticCurvePrivateKey(object):
 
         sn = _ec_key_curve_sn(backend, ec_key_cdata)
         self._curve = _sn_to_elliptic_curve(backend, sn)
+        self._order_bits = _ec_key_order_bits(backend, ec_key_cdata)
+        self._curve_nid = _ec_key_curve_nid(backend, ec_key_cdata)
+        self._uses = 0
+        self._precomputed = False
 
     curve = utils.read_only_property("_curve")
 
+    def precompute(self):
+        _ec_key_precompute(self._backend, self)
+
     def signer(self, signature_algorithm):
         if isinstance(signature_algorithm, ec.ECDSA):
             return _ECDSASignatureContext(
-                self._backend, self, signature_algorithm.algorithm
+                self._backend, self, signature_algorithm.algorithm,
+                signature_algorithm.signature_format
             )
         else:
             raise UnsupportedAlgorithm(
                 "Unsupported elliptic curve signature algorithm.",
                 _Reasons.UNSUPPORTED_PUBLIC_KEY_ALGORITHM)
 
+    def exchange(self, algorithm, peer_public_key):
+        if not (
+            self._backend.elliptic_curve_exchange_algorithm_supported(
+                algorithm, self.curve
+            )
+        ):
+            raise UnsupportedAlgorithm(
+                "This backend does not support the ECDH algorithm.",
+                _Reasons.UNSUPPORTED_EXCHANGE_ALGORITHM
+            )
+
+        if peer_public_key.curve.name != self.curve.name:
+            raise ValueError(
+                "peer_public_key and self are not on the same curve"
+            )
+
+        group = self._backend._lib.EC_KEY_get0_group(self._ec_key)
+        z_len = (self._backend._lib.EC_GROUP_get_degree(group) + 7) // 8
+        assert z_len > 0
+        z_buf = self._backend._ffi.new("uint8_t[]", z_len)
+        peer_key = self._backend._lib.EC_KEY_get0_public_key(
+            peer_public_key._ec_key
+        )
+
+        r = self._backend._lib.ECDH_compute_key(
+            z_buf, z_len, peer_key, self._ec_key, self._backend._ffi.NULL
+        )
+        if r <= 0:
+            self._backend._consume_errors()
+            raise ValueError("Unable to compute the ECDH shared key.")
+
+        return self._backend._ffi.buffer(z_buf)[:z_len]
+
     def public_key(self):
         group = self._backend._lib.EC_KEY_get0_group(self._ec_key)
         assert group != self._backend._ffi.NULL
@@ -226,13 +377,21 @@ class _EllipticCurvePublicKey(object):
 
         sn = _ec_key_curve_sn(backend, ec_key_cdata)
         self._curve = _sn_to_elliptic_curve(backend, sn)
+        self._order_bits = _ec_key_order_bits(backend, ec_key_cdata)
+        self._curve_nid = _ec_key_curve_nid(backend, ec_key_cdata)
+        self._uses = 0
+        self._precomputed = False
 
     curve = utils.read_only_property("_curve")
 
+    def precompute(self):
+        _ec_key_precompute(self._backend, self)
+
     def verifier(self, signature, signature_algorithm):
         if isinstance(signature_algorithm, ec.ECDSA):
             return _ECDSAVerificationContext(
-                self._backend, self, signature, signature_algorithm.algorithm
+                self._backend, self, signature, signature_algorithm.algorithm,
+                signature_algorithm.signature_format
             )
         else:
             raise UnsupportedAlgorithm(
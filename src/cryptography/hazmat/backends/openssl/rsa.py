@@ -10,6 +10,9 @@ from cryptography import utils
 from cryptography.exceptions import (
     AlreadyFinalized, InvalidSignature, UnsupportedAlgorithm, _Reasons
 )
+from cryptography.hazmat.backends.openssl.utils import (
+    _calculate_digest, _hash_ctx_for
+)
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import (
     AsymmetricSignatureContext, AsymmetricVerificationContext, rsa
@@ -20,6 +23,7 @@ from cryptography.hazmat.primitives.asymmetric.padding import (
 from cryptography.hazmat.primitives.asymmetric.rsa import (
     RSAPrivateKeyWithSerialization, RSAPublicKeyWithSerialization
 )
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 
 
 def _get_rsa_pss_salt_length(pss, key_size, digest_size):
@@ -146,6 +150,147 @@ def _handle_rsa_enc_dec_error(backend, key):
         raise ValueError("Decryption failed.")
 
 
+def _check_not_prehashed(algorithm):
+    # Without EVP_PKEY_CTX PKCS1v15 signatures are made with EVP_SignFinal,
+    # which has to do the hashing itself.
+    if isinstance(algorithm, Prehashed):
+        raise UnsupportedAlgorithm(
+            "Prehashed PKCS1v15 signatures require OpenSSL 1.0.0 or newer.",
+            _Reasons.UNSUPPORTED_HASH
+        )
+
+
+def _rsa_sig_pkey_ctx(backend, key, init, padding, padding_enum,
+                      algorithm, evp_md):
+    pkey_ctx = backend._lib.EVP_PKEY_CTX_new(key._evp_pkey, backend._ffi.NULL)
+    assert pkey_ctx != backend._ffi.NULL
+    pkey_ctx = backend._ffi.gc(pkey_ctx, backend._lib.EVP_PKEY_CTX_free)
+    res = init(pkey_ctx)
+    assert res == 1
+    res = backend._lib.EVP_PKEY_CTX_set_signature_md(pkey_ctx, evp_md)
+    assert res > 0
+
+    res = backend._lib.EVP_PKEY_CTX_set_rsa_padding(pkey_ctx, padding_enum)
+    assert res > 0
+    if isinstance(padding, PSS):
+        res = backend._lib.EVP_PKEY_CTX_set_rsa_pss_saltlen(
+            pkey_ctx,
+            _get_rsa_pss_salt_length(
+                padding, key.key_size, algorithm.digest_size
+            )
+        )
+        assert res > 0
+
+        if backend._lib.Cryptography_HAS_MGF1_MD:
+            # MGF1 MD is configurable in OpenSSL 1.0.1+
+            mgf1_md = backend._lib.EVP_get_digestbyname(
+                padding._mgf._algorithm.name.encode("ascii"))
+            assert mgf1_md != backend._ffi.NULL
+            res = backend._lib.EVP_PKEY_CTX_set_rsa_mgf1_md(
+                pkey_ctx, mgf1_md
+            )
+            assert res > 0
+
+    return pkey_ctx
+
+
+def _rsa_sig_sign(backend, pkey_ctx, data_to_sign):
+    buflen = backend._ffi.new("size_t *")
+    res = backend._lib.EVP_PKEY_sign(
+        pkey_ctx,
+        backend._ffi.NULL,
+        buflen,
+        data_to_sign,
+        len(data_to_sign)
+    )
+    assert res == 1
+    buf = backend._ffi.new("unsigned char[]", buflen[0])
+    res = backend._lib.EVP_PKEY_sign(
+        pkey_ctx, buf, buflen, data_to_sign, len(data_to_sign))
+    if res != 1:
+        errors = backend._consume_errors()
+        assert errors[0].lib == backend._lib.ERR_LIB_RSA
+        reason = None
+        if (errors[0].reason ==
+                backend._lib.RSA_R_DATA_TOO_LARGE_FOR_KEY_SIZE):
+            reason = ("Salt length too long for key size. Try using "
+                      "MAX_LENGTH instead.")
+        elif (errors[0].reason ==
+                backend._lib.RSA_R_DIGEST_TOO_BIG_FOR_RSA_KEY):
+            reason = "Digest too large for key size. Use a larger key."
+        assert reason is not None
+        raise ValueError(reason)
+
+    return backend._ffi.buffer(buf)[:]
+
+
+def _rsa_sig_verify(backend, pkey_ctx, signature, data_to_verify):
+    res = backend._lib.EVP_PKEY_verify(
+        pkey_ctx,
+        signature,
+        len(signature),
+        data_to_verify,
+        len(data_to_verify)
+    )
+    # The previous call can return negative numbers in the event of an
+    # error. This is not a signature failure but we need to fail if it
+    # occurs.
+    assert res >= 0
+    if res == 0:
+        errors = backend._consume_errors()
+        assert errors
+        raise InvalidSignature
+
+
+def _rsa_sig_cache_key(padding, algorithm):
+    mgf = getattr(padding, "_mgf", None)
+    if isinstance(algorithm, Prehashed):
+        hash_algorithm = algorithm._algorithm
+    else:
+        hash_algorithm = algorithm
+    return (
+        type(padding),
+        getattr(padding, "_salt_length", None),
+        type(mgf),
+        getattr(getattr(mgf, "_algorithm", None), "name", None),
+        type(algorithm),
+        type(hash_algorithm),
+        getattr(hash_algorithm, "name", None),
+    )
+
+
+def _rsa_sig_template(key, cache_key, make_ctx, init):
+    """
+    Returns the EVP_PKEY_CTX configured for cache_key, creating and
+    caching it on key if it doesn't exist yet. make_ctx() returns a
+    signature or verification context, which validates the padding and
+    algorithm, or None when the backend can't use EVP_PKEY_CTX.
+    """
+    template = key._sig_templates.get(cache_key)
+    if template is not None:
+        return template, None
+
+    ctx = make_ctx()
+    if not key._backend._lib.Cryptography_HAS_PKEY_CTX:
+        return None, ctx
+
+    evp_md = key._backend._lib.EVP_get_digestbyname(
+        ctx._algorithm.name.encode("ascii"))
+    assert evp_md != key._backend._ffi.NULL
+    template = _rsa_sig_pkey_ctx(
+        key._backend, key, init, ctx._padding, ctx._padding_enum,
+        ctx._algorithm, evp_md
+    )
+    key._sig_templates[cache_key] = template
+    return template, None
+
+
+def _rsa_sig_dup(backend, template):
+    pkey_ctx = backend._lib.EVP_PKEY_CTX_dup(template)
+    assert pkey_ctx != backend._ffi.NULL
+    return backend._ffi.gc(pkey_ctx, backend._lib.EVP_PKEY_CTX_free)
+
+
 @utils.register_interface(AsymmetricSignatureContext)
 class _RSASignatureContext(object):
     def __init__(self, backend, private_key, padding, algorithm):
@@ -164,6 +309,7 @@ class _RSASignatureContext(object):
                 self._finalize_method = self._finalize_pkey_ctx
                 self._padding_enum = self._backend._lib.RSA_PKCS1_PADDING
             else:
+                _check_not_prehashed(algorithm)
                 self._finalize_method = self._finalize_pkcs1
         elif isinstance(padding, PSS):
             if not isinstance(padding._mgf, MGF1):
@@ -198,8 +344,9 @@ class _RSASignatureContext(object):
             )
 
         self._padding = padding
-        self._algorithm = algorithm
-        self._hash_ctx = hashes.Hash(self._algorithm, self._backend)
+        self._algorithm, self._hash_ctx = _hash_ctx_for(
+            algorithm, self._backend
+        )
 
     def update(self, data):
         self._hash_ctx.update(data)
@@ -212,69 +359,14 @@ class _RSASignatureContext(object):
         return self._finalize_method(evp_md)
 
     def _finalize_pkey_ctx(self, evp_md):
-        pkey_ctx = self._backend._lib.EVP_PKEY_CTX_new(
-            self._private_key._evp_pkey, self._backend._ffi.NULL
+        pkey_ctx = _rsa_sig_pkey_ctx(
+            self._backend, self._private_key,
+            self._backend._lib.EVP_PKEY_sign_init, self._padding,
+            self._padding_enum, self._algorithm, evp_md
         )
-        assert pkey_ctx != self._backend._ffi.NULL
-        pkey_ctx = self._backend._ffi.gc(pkey_ctx,
-                                         self._backend._lib.EVP_PKEY_CTX_free)
-        res = self._backend._lib.EVP_PKEY_sign_init(pkey_ctx)
-        assert res == 1
-        res = self._backend._lib.EVP_PKEY_CTX_set_signature_md(
-            pkey_ctx, evp_md)
-        assert res > 0
-
-        res = self._backend._lib.EVP_PKEY_CTX_set_rsa_padding(
-            pkey_ctx, self._padding_enum)
-        assert res > 0
-        if isinstance(self._padding, PSS):
-            res = self._backend._lib.EVP_PKEY_CTX_set_rsa_pss_saltlen(
-                pkey_ctx,
-                _get_rsa_pss_salt_length(
-                    self._padding,
-                    self._private_key.key_size,
-                    self._hash_ctx.algorithm.digest_size
-                )
-            )
-            assert res > 0
-
-            if self._backend._lib.Cryptography_HAS_MGF1_MD:
-                # MGF1 MD is configurable in OpenSSL 1.0.1+
-                mgf1_md = self._backend._lib.EVP_get_digestbyname(
-                    self._padding._mgf._algorithm.name.encode("ascii"))
-                assert mgf1_md != self._backend._ffi.NULL
-                res = self._backend._lib.EVP_PKEY_CTX_set_rsa_mgf1_md(
-                    pkey_ctx, mgf1_md
-                )
-                assert res > 0
-        data_to_sign = self._hash_ctx.finalize()
-        buflen = self._backend._ffi.new("size_t *")
-        res = self._backend._lib.EVP_PKEY_sign(
-            pkey_ctx,
-            self._backend._ffi.NULL,
-            buflen,
-            data_to_sign,
-            len(data_to_sign)
+        return _rsa_sig_sign(
+            self._backend, pkey_ctx, self._hash_ctx.finalize()
         )
-        assert res == 1
-        buf = self._backend._ffi.new("unsigned char[]", buflen[0])
-        res = self._backend._lib.EVP_PKEY_sign(
-            pkey_ctx, buf, buflen, data_to_sign, len(data_to_sign))
-        if res != 1:
-            errors = self._backend._consume_errors()
-            assert errors[0].lib == self._backend._lib.ERR_LIB_RSA
-            reason = None
-            if (errors[0].reason ==
-                    self._backend._lib.RSA_R_DATA_TOO_LARGE_FOR_KEY_SIZE):
-                reason = ("Salt length too long for key size. Try using "
-                          "MAX_LENGTH instead.")
-            elif (errors[0].reason ==
-                    self._backend._lib.RSA_R_DIGEST_TOO_BIG_FOR_RSA_KEY):
-                reason = "Digest too large for key size. Use a larger key."
-            assert reason is not None
-            raise ValueError(reason)
-
-        return self._backend._ffi.buffer(buf)[:]
 
     def _finalize_pkcs1(self, evp_md):
         if self._hash_ctx._ctx is None:
@@ -352,6 +444,7 @@ class _RSAVerificationContext(object):
                 self._verify_method = self._verify_pkey_ctx
                 self._padding_enum = self._backend._lib.RSA_PKCS1_PADDING
             else:
+                _check_not_prehashed(algorithm)
                 self._verify_method = self._verify_pkcs1
         elif isinstance(padding, PSS):
             if not isinstance(padding._mgf, MGF1):
@@ -388,8 +481,9 @@ class _RSAVerificationContext(object):
             )
 
         self._padding = padding
-        self._algorithm = algorithm
-        self._hash_ctx = hashes.Hash(self._algorithm, self._backend)
+        self._algorithm, self._hash_ctx = _hash_ctx_for(
+            algorithm, self._backend
+        )
 
     def update(self, data):
         self._hash_ctx.update(data)
@@ -402,57 +496,15 @@ class _RSAVerificationContext(object):
         self._verify_method(evp_md)
 
     def _verify_pkey_ctx(self, evp_md):
-        pkey_ctx = self._backend._lib.EVP_PKEY_CTX_new(
-            self._public_key._evp_pkey, self._backend._ffi.NULL
+        pkey_ctx = _rsa_sig_pkey_ctx(
+            self._backend, self._public_key,
+            self._backend._lib.EVP_PKEY_verify_init, self._padding,
+            self._padding_enum, self._algorithm, evp_md
         )
-        assert pkey_ctx != self._backend._ffi.NULL
-        pkey_ctx = self._backend._ffi.gc(pkey_ctx,
-                                         self._backend._lib.EVP_PKEY_CTX_free)
-        res = self._backend._lib.EVP_PKEY_verify_init(pkey_ctx)
-        assert res == 1
-        res = self._backend._lib.EVP_PKEY_CTX_set_signature_md(
-            pkey_ctx, evp_md)
-        assert res > 0
-
-        res = self._backend._lib.EVP_PKEY_CTX_set_rsa_padding(
-            pkey_ctx, self._padding_enum)
-        assert res > 0
-        if isinstance(self._padding, PSS):
-            res = self._backend._lib.EVP_PKEY_CTX_set_rsa_pss_saltlen(
-                pkey_ctx,
-                _get_rsa_pss_salt_length(
-                    self._padding,
-                    self._public_key.key_size,
-                    self._hash_ctx.algorithm.digest_size
-                )
-            )
-            assert res > 0
-            if self._backend._lib.Cryptography_HAS_MGF1_MD:
-                # MGF1 MD is configurable in OpenSSL 1.0.1+
-                mgf1_md = self._backend._lib.EVP_get_digestbyname(
-                    self._padding._mgf._algorithm.name.encode("ascii"))
-                assert mgf1_md != self._backend._ffi.NULL
-                res = self._backend._lib.EVP_PKEY_CTX_set_rsa_mgf1_md(
-                    pkey_ctx, mgf1_md
-                )
-                assert res > 0
-
-        data_to_verify = self._hash_ctx.finalize()
-        res = self._backend._lib.EVP_PKEY_verify(
-            pkey_ctx,
-            self._signature,
-            len(self._signature),
-            data_to_verify,
-            len(data_to_verify)
+        _rsa_sig_verify(
+            self._backend, pkey_ctx, self._signature,
+            self._hash_ctx.finalize()
         )
-        # The previous call can return negative numbers in the event of an
-        # error. This is not a signature failure but we need to fail if it
-        # occurs.
-        assert res >= 0
-        if res == 0:
-            errors = self._backend._consume_errors()
-            assert errors
-            raise InvalidSignature
 
     def _verify_pkcs1(self, evp_md):
         if self._hash_ctx._ctx is None:
@@ -522,12 +574,30 @@ class _RSAPrivateKey(object):
         self._evp_pkey = evp_pkey
 
         self._key_size = self._backend._lib.BN_num_bits(self._rsa_cdata.n)
+        self._sig_templates = {}
 
     key_size = utils.read_only_property("_key_size")
 
     def signer(self, padding, algorithm):
         return _RSASignatureContext(self._backend, self, padding, algorithm)
 
+    def sign(self, data, padding, algorithm):
+        template, ctx = _rsa_sig_template(
+            self, _rsa_sig_cache_key(padding, algorithm),
+            lambda: _RSASignatureContext(
+                self._backend, self, padding, algorithm
+            ),
+            self._backend._lib.EVP_PKEY_sign_init
+        )
+        if template is None:
+            ctx.update(data)
+            return ctx.finalize()
+
+        return _rsa_sig_sign(
+            self._backend, _rsa_sig_dup(self._backend, template),
+            _calculate_digest(data, algorithm, self._backend)
+        )
+
     def decrypt(self, ciphertext, padding):
         key_size_bytes = int(math.ceil(self.key_size / 8.0))
         if key_size_bytes != len(ciphertext):
@@ -585,6 +655,7 @@ class _RSAPublicKey(object):
         self._evp_pkey = evp_pkey
 
         self._key_size = self._backend._lib.BN_num_bits(self._rsa_cdata.n)
+        self._sig_templates = {}
 
     key_size = utils.read_only_property("_key_size")
 
@@ -593,6 +664,27 @@ class _RSAPublicKey(object):
             self._backend, self, signature, padding, algorithm
         )
 
+    def verify(self, signature, data, padding, algorithm):
+        if not isinstance(signature, bytes):
+            raise TypeError("signature must be bytes.")
+
+        template, ctx = _rsa_sig_template(
+            self, _rsa_sig_cache_key(padding, algorithm),
+            lambda: _RSAVerificationContext(
+                self._backend, self, signature, padding, algorithm
+            ),
+            self._backend._lib.EVP_PKEY_verify_init
+        )
+        if template is None:
+            ctx.update(data)
+            ctx.verify()
+            return
+
+        _rsa_sig_verify(
+            self._backend, _rsa_sig_dup(self._backend, template), signature,
+            _calculate_digest(data, algorithm, self._backend)
+        )
+
     def encrypt(self, plaintext, padding):
         return _enc_dec_rsa(self._backend, self, plaintext, padding)
 
@@ -6,6 +6,11 @@ from __future__ import absolute_import, division, print_function
 
 import six
 
+from cryptography import utils
+from cryptography.exceptions import AlreadyFinalized
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
 
 def _truncate_digest(digest, order_bits):
     digest_len = len(digest)
@@ -24,3 +29,95 @@ def _truncate_digest(digest, order_bits):
         digest = digest[:-1] + six.int2byte(six.indexbytes(digest, -1) & mask)
 
     return digest
+
+
+def _raw_signature(backend, r, s, width):
+    """
+    Encodes the r and s BIGNUMs of a DSA_SIG or ECDSA_SIG as fixed width
+    big-endian integers, the r || s format of IEEE P1363.
+    """
+    buf = backend._ffi.new("unsigned char[]", 2 * width)
+    for offset, bn in ((0, r), (width, s)):
+        size = (backend._lib.BN_num_bits(bn) + 7) // 8
+        assert size <= width
+        res = backend._lib.BN_bn2bin(bn, buf + offset + width - size)
+        assert res == size
+
+    return backend._ffi.buffer(buf)[:]
+
+
+def _set_raw_signature(backend, sig, signature, width):
+    """
+    Sets r and s on a DSA_SIG or ECDSA_SIG from an r || s signature. Returns
+    False if the signature is not the expected length.
+    """
+    if len(signature) != 2 * width:
+        return False
+
+    for name, value in (("r", signature[:width]), ("s", signature[width:])):
+        bn = backend._lib.BN_bin2bn(value, width, getattr(sig, name))
+        assert bn != backend._ffi.NULL
+        setattr(sig, name, bn)
+
+    return True
+
+
+class _PrehashedContext(object):
+    """
+    Stands in for a hashes.Hash when the data given to a signature or
+    verification context is already a digest. finalize() returns the data
+    unchanged after checking its length.
+    """
+
+    def __init__(self, algorithm):
+        self._algorithm = algorithm
+        self._data = []
+
+    algorithm = utils.read_only_property("_algorithm")
+
+    def update(self, data):
+        if self._data is None:
+            raise AlreadyFinalized("Context was already finalized.")
+        if not isinstance(data, bytes):
+            raise TypeError("data must be bytes.")
+        self._data.append(data)
+
+    def finalize(self):
+        if self._data is None:
+            raise AlreadyFinalized("Context was already finalized.")
+        digest = b"".join(self._data)
+        self._data = None
+        return _check_prehashed_digest(digest, self._algorithm)
+
+
+def _check_prehashed_digest(digest, algorithm):
+    if len(digest) != algorithm.digest_size:
+        raise ValueError(
+            "The provided data must be the same length as the hash "
+            "algorithm's digest size."
+        )
+    return digest
+
+
+def _hash_ctx_for(algorithm, backend):
+    """
+    Returns the hash algorithm to use and a context that produces the
+    digest to sign or verify. For Prehashed the data is already the digest.
+    """
+    if isinstance(algorithm, Prehashed):
+        return (
+            algorithm._algorithm, _PrehashedContext(algorithm._algorithm)
+        )
+
+    return algorithm, hashes.Hash(algorithm, backend)
+
+
+def _calculate_digest(data, algorithm, backend):
+    if isinstance(algorithm, Prehashed):
+        if not isinstance(data, bytes):
+            raise TypeError("data must be bytes.")
+        return _check_prehashed_digest(data, algorithm._algorithm)
+
+    h = hashes.Hash(algorithm, backend)
+    h.update(data)
+    return h.finalize()
@@ -54,7 +54,11 @@ class Binding(object):
                 return
 
             # If nothing else has setup a locking callback already, we set up
-            # our own
+            # our own. The C implementation doesn't need the GIL, so it is
+            # preferred, and the Python one is used where it isn't available.
+            if cls.lib.Cryptography_setup_ssl_threads() == 1:
+                return
+
             num_locks = cls.lib.CRYPTO_num_locks()
             cls._locks = [threading.Lock() for n in range(num_locks)]
 
@@ -0,0 +1,32 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+from cryptography import utils
+
+
+class _MACKey(object):
+    """
+    Holds a keyed MAC context and hands out copies of it, shared by HMACKey
+    and CMACKey.
+    """
+    def __init__(self, ctx, algorithm):
+        self._ctx = ctx
+        self._algorithm = algorithm
+
+    algorithm = utils.read_only_property("_algorithm")
+
+    def new(self):
+        return self._ctx.copy()
+
+    def mac(self, data):
+        ctx = self.new()
+        ctx.update(data)
+        return ctx.finalize()
+
+    def verify(self, data, signature):
+        ctx = self.new()
+        ctx.update(data)
+        ctx.verify(signature)
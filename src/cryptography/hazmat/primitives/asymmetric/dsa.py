@@ -9,6 +9,9 @@ import abc
 import six
 
 from cryptography import utils
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    SignatureFormat, _check_signature_format
+)
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -107,6 +110,16 @@ class DSAPublicKeyWithSerialization(DSAPublicKey):
         """
 
 
+class DSA(object):
+    def __init__(self, algorithm, signature_format=SignatureFormat.DER):
+        _check_signature_format(signature_format)
+        self._algorithm = algorithm
+        self._signature_format = signature_format
+
+    algorithm = utils.read_only_property("_algorithm")
+    signature_format = utils.read_only_property("_signature_format")
+
+
 def generate_parameters(key_size, backend):
     return backend.generate_dsa_parameters(key_size)
 
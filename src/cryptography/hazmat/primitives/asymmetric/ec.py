@@ -9,6 +9,9 @@ import abc
 import six
 
 from cryptography import utils
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    SignatureFormat, _check_signature_format
+)
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -43,6 +46,13 @@ class EllipticCurvePrivateKey(object):
         Returns an AsymmetricSignatureContext used for signing data.
         """
 
+    @abc.abstractmethod
+    def exchange(self, algorithm, peer_public_key):
+        """
+        Performs a key exchange operation using the provided algorithm with the
+        provided peer's public key.
+        """
+
     @abc.abstractmethod
     def public_key(self):
         """
@@ -224,10 +234,17 @@ _CURVE_TYPES = {
 
 @utils.register_interface(EllipticCurveSignatureAlgorithm)
 class ECDSA(object):
-    def __init__(self, algorithm):
+    def __init__(self, algorithm, signature_format=SignatureFormat.DER):
+        _check_signature_format(signature_format)
         self._algorithm = algorithm
+        self._signature_format = signature_format
 
     algorithm = utils.read_only_property("_algorithm")
+    signature_format = utils.read_only_property("_signature_format")
+
+
+class ECDH(object):
+    pass
 
 
 def generate_private_key(curve, backend):
@@ -0,0 +1,304 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import collections
+import os
+import threading
+import time
+
+import six
+
+from cryptography import utils
+from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
+from cryptography.hazmat.backends.interfaces import (
+    EllipticCurveBackend, RSABackend
+)
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+
+_PEM_END = b"-----END ENCRYPTED PRIVATE KEY-----"
+
+# Seconds a worker waits after a failed generation before trying again.
+_RETRY_DELAY = 1.0
+
+# Serializes resetting pools in a forked child.
+_fork_lock = threading.Lock()
+
+
+class _KeyPool(object):
+    def __init__(self, backend, target_depth, workers):
+        if not isinstance(target_depth, six.integer_types):
+            raise TypeError("target_depth must be an integer type.")
+
+        if target_depth < 1:
+            raise ValueError("target_depth must be at least 1.")
+
+        if not isinstance(workers, six.integer_types):
+            raise TypeError("workers must be an integer type.")
+
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+
+        self._backend = backend
+        self._target_depth = target_depth
+        self._workers = workers
+        self._closed = False
+
+        self._hits = 0
+        self._misses = 0
+        self._generated = 0
+        self._generation_time = 0.0
+        self._failures = 0
+        self._last_error = None
+
+        self._start()
+
+    target_depth = utils.read_only_property("_target_depth")
+    hits = utils.read_only_property("_hits")
+    misses = utils.read_only_property("_misses")
+    generated = utils.read_only_property("_generated")
+    generation_time = utils.read_only_property("_generation_time")
+    failures = utils.read_only_property("_failures")
+    last_error = utils.read_only_property("_last_error")
+
+    @property
+    def depth(self):
+        self._check_fork()
+        return len(self._keys)
+
+    def _start(self):
+        self._cond = threading.Condition()
+        self._keys = collections.deque()
+        self._pending = 0
+
+        threads = [
+            threading.Thread(target=self._refill)
+            for _ in range(self._workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        self._threads = threads
+
+        # Set last: _check_fork treats a matching pid as meaning the pool
+        # has already been rebuilt for this process.
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        # A forked child inherits the queued keys but not the worker
+        # threads. Handing out the same private keys in two processes would
+        # be disastrous, so the child starts over with an empty pool.
+        if self._pid == os.getpid():
+            return
+
+        with _fork_lock:
+            if self._pid == os.getpid():
+                return
+
+            if self._closed:
+                self._keys = collections.deque()
+                self._threads = []
+                self._pid = os.getpid()
+            else:
+                self._start()
+
+    def get(self):
+        self._check_fork()
+        with self._cond:
+            if self._closed:
+                raise ValueError("The key pool has been closed.")
+
+            if self._keys:
+                self._hits += 1
+                # Wake a worker to replace the key that was taken.
+                self._cond.notify_all()
+                return self._keys.popleft()
+
+            self._misses += 1
+
+        # The pool is empty, so the caller pays for generation just as it
+        # would without a pool.
+        return self._generate()
+
+    def fill(self, timeout=None):
+        self._check_fork()
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while len(self._keys) < self._target_depth and not self._closed:
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+            return len(self._keys) >= self._target_depth
+
+    def close(self):
+        self._check_fork()
+        with self._cond:
+            self._closed = True
+            self._keys.clear()
+            self._cond.notify_all()
+
+        for thread in self._threads:
+            thread.join()
+
+    def spill(self, password):
+        if not isinstance(password, bytes):
+            raise TypeError("password must be bytes.")
+
+        self._check_fork()
+        with self._cond:
+            keys = list(self._keys)
+            self._keys.clear()
+            self._cond.notify_all()
+
+        encryption = serialization.BestAvailableEncryption(password)
+        return b"".join(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                encryption
+            )
+            for key in keys
+        )
+
+    def load(self, data, password):
+        if not isinstance(data, bytes):
+            raise TypeError("data must be bytes.")
+
+        keys = []
+        for block in data.split(_PEM_END)[:-1]:
+            key = serialization.load_pem_private_key(
+                block + _PEM_END, password, self._backend
+            )
+            if not self._matches(key):
+                raise ValueError(
+                    "The spilled keys do not match the parameters of this "
+                    "pool."
+                )
+
+            keys.append(key)
+
+        self._check_fork()
+        with self._cond:
+            if self._closed:
+                raise ValueError("The key pool has been closed.")
+
+            self._keys.extend(keys)
+            self._cond.notify_all()
+
+        return len(keys)
+
+    def _generate(self):
+        start = time.time()
+        key = self._generate_key()
+        elapsed = time.time() - start
+        with self._cond:
+            self._generated += 1
+            self._generation_time += elapsed
+
+        return key
+
+    def _refill(self):
+        while True:
+            with self._cond:
+                while (
+                    not self._closed and
+                    len(self._keys) + self._pending >= self._target_depth
+                ):
+                    self._cond.wait()
+
+                if self._closed:
+                    return
+
+                self._pending += 1
+
+            try:
+                key = self._generate()
+            except Exception as e:
+                # Keep the worker alive so the pool recovers once the cause
+                # goes away, but don't spin on a persistent failure.
+                with self._cond:
+                    self._pending -= 1
+                    self._failures += 1
+                    self._last_error = e
+                    if not self._closed:
+                        self._cond.wait(_RETRY_DELAY)
+                continue
+
+            with self._cond:
+                self._pending -= 1
+                if self._closed:
+                    return
+
+                self._keys.append(key)
+                self._cond.notify_all()
+
+
+class RSAKeyPool(_KeyPool):
+    def __init__(self, public_exponent, key_size, backend, target_depth,
+                 workers=1):
+        if not isinstance(backend, RSABackend):
+            raise UnsupportedAlgorithm(
+                "Backend object does not implement RSABackend.",
+                _Reasons.BACKEND_MISSING_INTERFACE
+            )
+
+        rsa._verify_rsa_parameters(public_exponent, key_size)
+
+        self._public_exponent = public_exponent
+        self._key_size = key_size
+        super(RSAKeyPool, self).__init__(backend, target_depth, workers)
+
+    public_exponent = utils.read_only_property("_public_exponent")
+    key_size = utils.read_only_property("_key_size")
+
+    def _generate_key(self):
+        return self._backend.generate_rsa_private_key(
+            self._public_exponent, self._key_size
+        )
+
+    def _matches(self, key):
+        return (
+            isinstance(key, rsa.RSAPrivateKey) and
+            key.key_size == self._key_size and
+            key.public_key().public_numbers().e == self._public_exponent
+        )
+
+
+class EllipticCurveKeyPool(_KeyPool):
+    def __init__(self, curve, backend, target_depth, workers=1):
+        if not isinstance(backend, EllipticCurveBackend):
+            raise UnsupportedAlgorithm(
+                "Backend object does not implement EllipticCurveBackend.",
+                _Reasons.BACKEND_MISSING_INTERFACE
+            )
+
+        if not backend.elliptic_curve_supported(curve):
+            raise UnsupportedAlgorithm(
+                "This backend does not support this elliptic curve.",
+                _Reasons.UNSUPPORTED_ELLIPTIC_CURVE
+            )
+
+        self._curve = curve
+        super(EllipticCurveKeyPool, self).__init__(
+            backend, target_depth, workers
+        )
+
+    curve = utils.read_only_property("_curve")
+
+    def _generate_key(self):
+        return self._backend.generate_elliptic_curve_private_key(self._curve)
+
+    def _matches(self, key):
+        return (
+            isinstance(key, ec.EllipticCurvePrivateKey) and
+            key.curve.name == self._curve.name
+        )
@@ -22,6 +22,12 @@ class RSAPrivateKey(object):
         Returns an AsymmetricSignatureContext used for signing data.
         """
 
+    @abc.abstractmethod
+    def sign(self, data, padding, algorithm):
+        """
+        Signs the data.
+        """
+
     @abc.abstractmethod
     def decrypt(self, ciphertext, padding):
         """
@@ -64,6 +70,12 @@ class RSAPublicKey(object):
         Returns an AsymmetricVerificationContext used for verifying signatures.
         """
 
+    @abc.abstractmethod
+    def verify(self, signature, data, padding, algorithm):
+        """
+        Verifies the signature of the data.
+        """
+
     @abc.abstractmethod
     def encrypt(self, plaintext, padding):
         """
@@ -4,39 +4,102 @@
 
 from __future__ import absolute_import, division, print_function
 
-from pyasn1.codec.ber import eoo
-from pyasn1.codec.der import decoder, encoder
-from pyasn1.error import PyAsn1Error
-from pyasn1.type import namedtype, univ
+import binascii
+from enum import Enum
 
 import six
 
+from cryptography import utils
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import rsa
 
-class _DSSSigValue(univ.Sequence):
-    componentType = namedtype.NamedTypes(
-        namedtype.NamedType('r', univ.Integer()),
-        namedtype.NamedType('s', univ.Integer())
-    )
 
+_INVALID_SIGNATURE_DATA = "Invalid signature data. Unable to decode ASN.1"
+
+_DER_INTEGER = 0x02
+_DER_SEQUENCE = 0x30
+
+
+def _bytes_to_int(data):
+    return int(binascii.hexlify(data), 16) if data else 0
+
+
+def _int_to_bytes(value, length):
+    return binascii.unhexlify("{0:0{1}x}".format(value, length * 2))
+
+
+def _der_length(length):
+    if length < 0x80:
+        return six.int2byte(length)
+
+    size = (utils.bit_length(length) + 7) // 8
+    return six.int2byte(0x80 | size) + _int_to_bytes(length, size)
+
+
+def _der_integer(value):
+    # DER integers are minimal two's complement, so one extra bit is needed
+    # for the sign.
+    if value >= 0:
+        length = utils.bit_length(value) // 8 + 1
+    else:
+        length = utils.bit_length(-value - 1) // 8 + 1
+
+    content = _int_to_bytes(value % (1 << (8 * length)), length)
+    return six.int2byte(_DER_INTEGER) + _der_length(length) + content
 
-def decode_rfc6979_signature(signature):
-    try:
-        data, remaining = decoder.decode(signature, asn1Spec=_DSSSigValue())
-    except PyAsn1Error:
-        raise ValueError("Invalid signature data. Unable to decode ASN.1")
 
-    if remaining:
+def _read_der(data, offset, tag):
+    """
+    Reads the header of the DER element with the given tag that starts at
+    offset and returns the offsets of the start and end of its content.
+    """
+    if offset + 2 > len(data) or six.indexbytes(data, offset) != tag:
+        raise ValueError(_INVALID_SIGNATURE_DATA)
+
+    length = six.indexbytes(data, offset + 1)
+    offset += 2
+    if length & 0x80:
+        size = length & 0x7f
+        if size == 0 or size > 4 or offset + size > len(data):
+            raise ValueError(_INVALID_SIGNATURE_DATA)
+
+        length = _bytes_to_int(data[offset:offset + size])
+        offset += size
+
+    if offset + length > len(data):
+        raise ValueError(_INVALID_SIGNATURE_DATA)
+
+    return offset, offset + length
+
+
+def _read_der_integer(data, offset):
+    start, end = _read_der(data, offset, _DER_INTEGER)
+    content = data[start:end]
+    if not content:
+        raise ValueError(_INVALID_SIGNATURE_DATA)
+
+    # Like the pyasn1 decoder this replaces, non-minimal integers are
+    # accepted so that signatures which used to decode still do.
+    value = _bytes_to_int(content)
+    if six.indexbytes(content, 0) & 0x80:
+        value -= 1 << (8 * len(content))
+
+    return value, end
+
+
+def decode_rfc6979_signature(signature):
+    start, end = _read_der(signature, 0, _DER_SEQUENCE)
+    if end != len(signature):
         raise ValueError(
             "The signature contains bytes after the end of the ASN.1 sequence."
         )
-    # pyasn1 can erroneously return this from top-level DER decoding.
-    # It's intended as a sentinel in recursive BER decoding, so it's
-    # returned even though an asn1Spec is provided.
-    if eoo.endOfOctets.isSameTypeWith(data) and data == eoo.endOfOctets:
-        raise ValueError("Invalid signature data. Unable to decode ASN.1")
-
-    r = int(data.getComponentByName('r'))
-    s = int(data.getComponentByName('s'))
+
+    r, offset = _read_der_integer(signature, start)
+    s, offset = _read_der_integer(signature, offset)
+    if offset != end:
+        raise ValueError(_INVALID_SIGNATURE_DATA)
+
     return (r, s)
 
 
@@ -47,7 +110,87 @@ def encode_rfc6979_signature(r, s):
     ):
         raise ValueError("Both r and s must be integers")
 
-    sig = _DSSSigValue()
-    sig.setComponentByName('r', r)
-    sig.setComponentByName('s', s)
-    return encoder.encode(sig)
+    content = _der_integer(r) + _der_integer(s)
+    return six.int2byte(_DER_SEQUENCE) + _der_length(len(content)) + content
+
+
+def raw_to_rfc6979_signatures(signatures):
+    result = []
+    for signature in signatures:
+        if not isinstance(signature, bytes):
+            raise TypeError("signature must be bytes.")
+
+        if not signature or len(signature) % 2:
+            raise ValueError(
+                "Raw signatures must be r and s of equal length concatenated."
+            )
+
+        half = len(signature) // 2
+        result.append(encode_rfc6979_signature(
+            _bytes_to_int(signature[:half]), _bytes_to_int(signature[half:])
+        ))
+
+    return result
+
+
+def rfc6979_to_raw_signatures(signatures, length):
+    if not isinstance(length, six.integer_types):
+        raise TypeError("length must be an integer type.")
+
+    if length < 1:
+        raise ValueError("length must be at least 1.")
+
+    limit = 1 << (8 * length)
+    result = []
+    for signature in signatures:
+        r, s = decode_rfc6979_signature(signature)
+        if not 0 <= r < limit or not 0 <= s < limit:
+            raise ValueError(
+                "r and s must be non-negative and fit in length bytes."
+            )
+
+        result.append(_int_to_bytes(r, length) + _int_to_bytes(s, length))
+
+    return result
+
+
+class SignatureFormat(Enum):
+    DER = "DER"
+    RAW = "RAW"
+
+
+def _check_signature_format(signature_format):
+    if not isinstance(signature_format, SignatureFormat):
+        raise TypeError(
+            "signature_format must be an item from the SignatureFormat enum."
+        )
+
+
+class Prehashed(object):
+    def __init__(self, algorithm):
+        if not isinstance(algorithm, hashes.HashAlgorithm):
+            raise TypeError("Expected instance of HashAlgorithm.")
+
+        self._algorithm = algorithm
+        self._digest_size = algorithm.digest_size
+
+    digest_size = utils.read_only_property("_digest_size")
+
+
+def _verify_one(item):
+    public_key, signature, data = item[:3]
+    args = item[3:]
+    try:
+        if isinstance(public_key, rsa.RSAPublicKey):
+            public_key.verify(signature, data, *args)
+        else:
+            verifier = public_key.verifier(signature, *args)
+            verifier.update(data)
+            verifier.verify()
+    except InvalidSignature:
+        return False
+    return True
+
+
+def verify_many(items, workers=None):
+    return utils._parallel_map(_verify_one, items, workers)
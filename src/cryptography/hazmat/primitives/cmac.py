@@ -10,6 +10,7 @@ from cryptography.exceptions import (
 )
 from cryptography.hazmat.backends.interfaces import CMACBackend
 from cryptography.hazmat.primitives import ciphers, interfaces
+from cryptography.hazmat.primitives._mac import _MACKey
 
 
 @utils.register_interface(interfaces.MACContext)
@@ -64,3 +65,13 @@ class CMAC(object):
             backend=self._backend,
             ctx=self._ctx.copy()
         )
+
+
+class CMACKey(_MACKey):
+    def __init__(self, algorithm, backend):
+        super(CMACKey, self).__init__(CMAC(algorithm, backend), algorithm)
+
+
+def cmac_many(algorithm, messages, backend):
+    cmac_key = CMACKey(algorithm, backend)
+    return [cmac_key.mac(message) for message in messages]
@@ -107,6 +107,26 @@ class Hash(object):
         return digest
 
 
+class HashPrefix(object):
+    def __init__(self, algorithm, prefix, backend):
+        if not isinstance(prefix, bytes):
+            raise TypeError("prefix must be bytes.")
+
+        self._hash = Hash(algorithm, backend)
+        self._hash.update(prefix)
+        self._algorithm = algorithm
+
+    algorithm = utils.read_only_property("_algorithm")
+
+    def new(self):
+        return self._hash.copy()
+
+    def digest(self, data):
+        h = self.new()
+        h.update(data)
+        return h.finalize()
+
+
 @utils.register_interface(HashAlgorithm)
 class SHA1(object):
     name = "sha1"
@@ -6,10 +6,11 @@ from __future__ import absolute_import, division, print_function
 
 from cryptography import utils
 from cryptography.exceptions import (
-    AlreadyFinalized, UnsupportedAlgorithm, _Reasons
+    AlreadyFinalized, InvalidSignature, UnsupportedAlgorithm, _Reasons
 )
 from cryptography.hazmat.backends.interfaces import HMACBackend
 from cryptography.hazmat.primitives import hashes, interfaces
+from cryptography.hazmat.primitives._mac import _MACKey
 
 
 @utils.register_interface(interfaces.MACContext)
@@ -67,3 +68,35 @@ class HMAC(object):
 
         ctx, self._ctx = self._ctx, None
         ctx.verify(signature)
+
+
+class HMACKey(_MACKey):
+    def __init__(self, key, algorithm, backend):
+        super(HMACKey, self).__init__(
+            HMAC(key, algorithm, backend), algorithm
+        )
+
+
+def _verify_prepared(item):
+    hmac_key, data, signature = item
+    try:
+        hmac_key.verify(data, signature)
+    except InvalidSignature:
+        return False
+    return True
+
+
+def verify_many(items, backend, workers=None):
+    keys = {}
+    prepared = []
+    for key, algorithm, data, signature in items:
+        try:
+            hmac_key = keys[key, algorithm.name]
+        except KeyError:
+            hmac_key = keys[key, algorithm.name] = HMACKey(
+                key, algorithm, backend
+            )
+
+        prepared.append((hmac_key, data, signature))
+
+    return utils._parallel_map(_verify_prepared, prepared, workers)
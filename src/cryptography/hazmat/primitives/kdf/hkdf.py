@@ -67,7 +67,13 @@ class HKDFExpand(object):
 
         self._backend = backend
 
-        max_length = 255 * (algorithm.digest_size // 8)
+        self._length = self._check_length(length)
+        self._info = self._check_info(info)
+
+        self._used = False
+
+    def _check_length(self, length):
+        max_length = 255 * (self._algorithm.digest_size // 8)
 
         if length > max_length:
             raise ValueError(
@@ -75,31 +81,30 @@ class HKDFExpand(object):
                     max_length
                 ))
 
-        self._length = length
+        return length
 
+    def _check_info(self, info):
         if not (info is None or isinstance(info, bytes)):
             raise TypeError("info must be bytes.")
 
         if info is None:
             info = b""
 
-        self._info = info
+        return info
 
-        self._used = False
-
-    def _expand(self, key_material):
+    def _expand(self, hmac_key, info, length):
         output = [b""]
         counter = 1
 
-        while (self._algorithm.digest_size // 8) * len(output) < self._length:
-            h = hmac.HMAC(key_material, self._algorithm, backend=self._backend)
+        while (self._algorithm.digest_size // 8) * len(output) < length:
+            h = hmac_key.new()
             h.update(output[-1])
-            h.update(self._info)
+            h.update(info)
             h.update(six.int2byte(counter))
             output.append(h.finalize())
             counter += 1
 
-        return b"".join(output)[:self._length]
+        return b"".join(output)[:length]
 
     def derive(self, key_material):
         if not isinstance(key_material, bytes):
@@ -109,7 +114,26 @@ class HKDFExpand(object):
             raise AlreadyFinalized
 
         self._used = True
-        return self._expand(key_material)
+        hmac_key = hmac.HMACKey(key_material, self._algorithm, self._backend)
+        return self._expand(hmac_key, self._info, self._length)
+
+    def derive_many(self, key_material, labels):
+        if not isinstance(key_material, bytes):
+            raise TypeError("key_material must be bytes.")
+
+        labels = [
+            (self._check_info(info), self._check_length(length))
+            for info, length in labels
+        ]
+
+        if self._used:
+            raise AlreadyFinalized
+
+        self._used = True
+        hmac_key = hmac.HMACKey(key_material, self._algorithm, self._backend)
+        return [
+            self._expand(hmac_key, info, length) for info, length in labels
+        ]
 
     def verify(self, key_material, expected_key):
         if not constant_time.bytes_eq(self.derive(key_material), expected_key):
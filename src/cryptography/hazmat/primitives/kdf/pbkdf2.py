@@ -56,3 +56,14 @@ class PBKDF2HMAC(object):
         derived_key = self.derive(key_material)
         if not constant_time.bytes_eq(derived_key, expected_key):
             raise InvalidKey("Keys do not match.")
+
+
+def derive_many(algorithm, length, items, iterations, backend, workers=None,
+                max_pending=None):
+    def derive(item):
+        salt, key_material = item
+        return PBKDF2HMAC(
+            algorithm, length, salt, iterations, backend
+        ).derive(key_material)
+
+    return utils._parallel_map(derive, items, workers, max_pending)
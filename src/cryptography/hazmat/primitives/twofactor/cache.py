@@ -0,0 +1,93 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import collections
+import threading
+
+import six
+
+from cryptography.hazmat.primitives.twofactor.hotp import HOTP
+from cryptography.hazmat.primitives.twofactor.totp import TOTP
+
+
+class OTPCache(object):
+    def __init__(self, max_entries):
+        if not isinstance(max_entries, six.integer_types):
+            raise TypeError("max_entries must be an integer type.")
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._tick = 0
+        # Maps a cache key to [last use, object]. _order holds a
+        # (last use, cache key) pair for every use and stale pairs are
+        # skipped when evicting, so a hit never has to search the queue.
+        self._entries = {}
+        self._order = collections.deque()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+
+    def hotp(self, key, length, algorithm, backend):
+        return self._get(
+            key, backend, ("hotp", length, type(algorithm)),
+            lambda: HOTP(key, length, algorithm, backend)
+        )
+
+    def totp(self, key, length, algorithm, time_step, backend):
+        return self._get(
+            key, backend, ("totp", length, type(algorithm), time_step),
+            lambda: TOTP(key, length, algorithm, time_step, backend)
+        )
+
+    def _get(self, key, backend, params, factory):
+        if not isinstance(key, bytes):
+            raise TypeError("key must be bytes.")
+
+        cache_key = params + (backend, key)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._touch(cache_key, entry)
+                return entry[1]
+
+        # Keying the HMAC is the expensive part, so it happens outside the
+        # lock. If two threads race the first object stored wins.
+        obj = factory()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                entry = self._entries[cache_key] = [None, obj]
+                self._evict()
+            self._touch(cache_key, entry)
+            return entry[1]
+
+    def _touch(self, cache_key, entry):
+        self._tick += 1
+        entry[0] = self._tick
+        self._order.append((self._tick, cache_key))
+        if len(self._order) > 2 * self._max_entries:
+            self._order = collections.deque(sorted(
+                (e[0], k) for k, e in six.iteritems(self._entries)
+            ))
+
+    def _evict(self):
+        while len(self._entries) > self._max_entries:
+            tick, cache_key = self._order.popleft()
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == tick:
+                del self._entries[cache_key]
+
+
+default_cache = OTPCache(1024)
@@ -18,6 +18,48 @@ from cryptography.hazmat.primitives.twofactor import InvalidToken
 from cryptography.hazmat.primitives.twofactor.utils import _generate_uri
 
 
+def _check_key(key, algorithm):
+    if len(key) < 16:
+        raise ValueError("Key length has to be at least 128 bits.")
+
+    if not isinstance(algorithm, (SHA1, SHA256, SHA512)):
+        raise TypeError("Algorithm must be SHA1, SHA256 or SHA512.")
+
+
+def _check_length(length):
+    if not isinstance(length, six.integer_types):
+        raise TypeError("Length parameter must be an integer type.")
+
+    if length < 6 or length > 8:
+        raise ValueError("Length of HOTP has to be between 6 to 8.")
+
+
+def _truncate(ctx, counter):
+    ctx.update(struct.pack(">Q", counter))
+    hmac_value = ctx.finalize()
+
+    offset = six.indexbytes(hmac_value, len(hmac_value) - 1) & 0b1111
+    p = hmac_value[offset:offset + 4]
+    return struct.unpack(">I", p)[0] & 0x7fffffff
+
+
+def _format(truncated_value, length):
+    hotp = truncated_value % (10 ** length)
+    return "{0:0{1}}".format(hotp, length).encode()
+
+
+def _match_counters(hmac_key, length, hotp, counters):
+    # Every candidate is generated and compared, even after a match, so
+    # the time taken doesn't reveal which counter matched.
+    matched = None
+    for counter in counters:
+        candidate = _format(_truncate(hmac_key.new(), counter), length)
+        if constant_time.bytes_eq(candidate, hotp) and matched is None:
+            matched = counter
+
+    return matched
+
+
 class HOTP(object):
     def __init__(self, key, length, algorithm, backend):
         if not isinstance(backend, HMACBackend):
@@ -26,40 +68,45 @@ class HOTP(object):
                 _Reasons.BACKEND_MISSING_INTERFACE
             )
 
-        if len(key) < 16:
-            raise ValueError("Key length has to be at least 128 bits.")
-
-        if not isinstance(length, six.integer_types):
-            raise TypeError("Length parameter must be an integer type.")
-
-        if length < 6 or length > 8:
-            raise ValueError("Length of HOTP has to be between 6 to 8.")
-
-        if not isinstance(algorithm, (SHA1, SHA256, SHA512)):
-            raise TypeError("Algorithm must be SHA1, SHA256 or SHA512.")
+        _check_key(key, algorithm)
+        _check_length(length)
 
         self._key = key
         self._length = length
         self._algorithm = algorithm
         self._backend = backend
+        self._hmac_key = hmac.HMACKey(key, algorithm, backend)
 
     def generate(self, counter):
-        truncated_value = self._dynamic_truncate(counter)
-        hotp = truncated_value % (10 ** self._length)
-        return "{0:0{1}}".format(hotp, self._length).encode()
+        return self._generate(counter)
 
     def verify(self, hotp, counter):
         if not constant_time.bytes_eq(self.generate(counter), hotp):
             raise InvalidToken("Supplied HOTP value does not match.")
 
-    def _dynamic_truncate(self, counter):
-        ctx = hmac.HMAC(self._key, self._algorithm, self._backend)
-        ctx.update(struct.pack(">Q", counter))
-        hmac_value = ctx.finalize()
+    def verify_window(self, hotp, counter, look_ahead):
+        if not isinstance(look_ahead, six.integer_types):
+            raise TypeError("look_ahead must be an integer type.")
+
+        if look_ahead < 0:
+            raise ValueError("look_ahead must be non-negative.")
 
-        offset = six.indexbytes(hmac_value, len(hmac_value) - 1) & 0b1111
-        p = hmac_value[offset:offset + 4]
-        return struct.unpack(">I", p)[0] & 0x7fffffff
+        matched = self._match_counters(
+            hotp, range(counter, counter + look_ahead + 1)
+        )
+        if matched is None:
+            raise InvalidToken("Supplied HOTP value does not match.")
+
+        return matched
+
+    def _match_counters(self, hotp, counters):
+        return _match_counters(self._hmac_key, self._length, hotp, counters)
+
+    def _generate(self, counter):
+        return _format(self._dynamic_truncate(counter), self._length)
+
+    def _dynamic_truncate(self, counter):
+        return _truncate(self._hmac_key.new(), counter)
 
     def get_provisioning_uri(self, account_name, counter, issuer):
         return _generate_uri(self, 'hotp', account_name, issuer, [
@@ -0,0 +1,93 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import abc
+import heapq
+import itertools
+import threading
+
+import six
+
+from cryptography import utils
+from cryptography.hazmat.primitives.twofactor import InvalidToken
+
+
+@six.add_metaclass(abc.ABCMeta)
+class ReplayStorage(object):
+    @abc.abstractmethod
+    def add(self, key, expires):
+        """
+        Records key until the time expires. Returns False if key was already
+        recorded or cannot be recorded, in which case the token must be
+        rejected.
+        """
+
+    @abc.abstractmethod
+    def evict(self, now):
+        """
+        Removes every key that expired at or before now.
+        """
+
+
+@utils.register_interface(ReplayStorage)
+class MemoryReplayStorage(object):
+    def __init__(self, max_entries):
+        if not isinstance(max_entries, six.integer_types):
+            raise TypeError("max_entries must be an integer type.")
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        self._max_entries = max_entries
+        self._entries = set()
+        # A heap of (expires, sequence, key) so the next key to expire is
+        # always first, whatever order keys were added in. The sequence
+        # number keeps keys themselves from ever being compared.
+        self._expiry = []
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key, expires):
+        if key in self._entries:
+            return False
+
+        # Dropping a key that has not expired would let it be replayed, so a
+        # full store refuses new keys instead.
+        if len(self._entries) >= self._max_entries:
+            return False
+
+        self._entries.add(key)
+        heapq.heappush(self._expiry, (expires, next(self._sequence), key))
+        return True
+
+    def evict(self, now):
+        while self._expiry and self._expiry[0][0] <= now:
+            _, _, key = heapq.heappop(self._expiry)
+            self._entries.remove(key)
+
+
+class ReplayCache(object):
+    def __init__(self, ttl, storage):
+        if not isinstance(storage, ReplayStorage):
+            raise TypeError("Expected instance of ReplayStorage.")
+
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+
+        self._ttl = ttl
+        self._storage = storage
+        self._lock = threading.Lock()
+
+    def use(self, account, counter, now):
+        with self._lock:
+            self._storage.evict(now)
+            if not self._storage.add((account, counter), now + self._ttl):
+                raise InvalidToken(
+                    "Supplied token has already been used or could not be "
+                    "recorded."
+                )
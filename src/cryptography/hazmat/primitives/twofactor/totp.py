@@ -4,16 +4,34 @@
 
 from __future__ import absolute_import, division, print_function
 
+import six
+
+from cryptography import utils
 from cryptography.exceptions import (
     UnsupportedAlgorithm, _Reasons
 )
 from cryptography.hazmat.backends.interfaces import HMACBackend
-from cryptography.hazmat.primitives import constant_time
+from cryptography.hazmat.primitives import hmac
 from cryptography.hazmat.primitives.twofactor import InvalidToken
-from cryptography.hazmat.primitives.twofactor.hotp import HOTP
+from cryptography.hazmat.primitives.twofactor.hotp import (
+    HOTP, _check_key, _check_length, _match_counters
+)
 from cryptography.hazmat.primitives.twofactor.utils import _generate_uri
 
 
+def _check_window(window):
+    if not isinstance(window, six.integer_types):
+        raise TypeError("window must be an integer type.")
+
+    if window < 0:
+        raise ValueError("window must be non-negative.")
+
+
+def _window_counters(time, time_step, window):
+    counter = int(time / time_step)
+    return range(max(counter - window, 0), counter + window + 1)
+
+
 class TOTP(object):
     def __init__(self, key, length, algorithm, time_step, backend):
         if not isinstance(backend, HMACBackend):
@@ -29,11 +47,68 @@ class TOTP(object):
         counter = int(time / self._time_step)
         return self._hotp.generate(counter)
 
-    def verify(self, totp, time):
-        if not constant_time.bytes_eq(self.generate(time), totp):
+    def verify(self, totp, time, window=0):
+        _check_window(window)
+        matched = self._hotp._match_counters(
+            totp, _window_counters(time, self._time_step, window)
+        )
+        if matched is None:
             raise InvalidToken("Supplied TOTP value does not match.")
 
+        return matched
+
     def get_provisioning_uri(self, account_name, issuer):
         return _generate_uri(self._hotp, 'totp', account_name, issuer, [
             ('period', int(self._time_step)),
         ])
+
+
+def _prepare_item(keys, key, totp, length, algorithm, backend):
+    if not isinstance(totp, bytes):
+        raise TypeError("totp must be bytes.")
+
+    _check_length(length)
+    try:
+        return keys[key, type(algorithm)]
+    except KeyError:
+        _check_key(key, algorithm)
+        hmac_key = keys[key, type(algorithm)] = hmac.HMACKey(
+            key, algorithm, backend
+        )
+        return hmac_key
+
+
+def _match_prepared(item):
+    if item is None:
+        return None
+
+    hmac_key, length, totp, counters = item
+    return _match_counters(hmac_key, length, totp, counters)
+
+
+def verify_many(items, time, backend, window=0, time_step=30, workers=None):
+    if not isinstance(backend, HMACBackend):
+        raise UnsupportedAlgorithm(
+            "Backend object does not implement HMACBackend.",
+            _Reasons.BACKEND_MISSING_INTERFACE
+        )
+
+    _check_window(window)
+    counters = _window_counters(time, time_step, window)
+
+    keys = {}
+    prepared = []
+    for key, totp, length, algorithm in items:
+        # A malformed item can never match, but it shouldn't cost the rest
+        # of the batch its results.
+        try:
+            hmac_key = _prepare_item(
+                keys, key, totp, length, algorithm, backend
+            )
+        except (TypeError, ValueError):
+            prepared.append(None)
+            continue
+
+        prepared.append((hmac_key, length, totp, counters))
+
+    return utils._parallel_map(_match_prepared, prepared, workers)
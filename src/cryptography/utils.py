@@ -5,10 +5,17 @@
 from __future__ import absolute_import, division, print_function
 
 import abc
+import collections
 import inspect
+import multiprocessing
+import os
 import sys
+import threading
 import warnings
 
+import six
+from six.moves import queue
+
 
 DeprecatedIn09 = DeprecationWarning
 
@@ -17,9 +24,18 @@ def read_only_property(name):
     return property(lambda self: getattr(self, name))
 
 
+# Checking every registered class's signatures on import adds to process
+# start up time. The test suite imports every module with the checks
+# enabled, so deployments can set this to skip them.
+_verify_interfaces = not os.environ.get(
+    "CRYPTOGRAPHY_SKIP_INTERFACE_VERIFICATION"
+)
+
+
 def register_interface(iface):
     def register_decorator(klass):
-        verify_interface(iface, klass)
+        if _verify_interfaces:
+            verify_interface(iface, klass)
         iface.register(klass)
         return klass
     return register_decorator
@@ -57,6 +73,151 @@ else:
         return len(bin(x)) - (2 + (x <= 0))
 
 
+def _cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+class _WorkerPool(object):
+    """
+    A fixed size set of daemon threads shared by every _parallel_map call, so
+    concurrent callers queue for the same threads instead of each starting
+    their own. Threads are started lazily and, because they do not survive
+    os.fork(), restarted in a child process.
+    """
+    def __init__(self, size):
+        self._size = size
+        self._lock = threading.Lock()
+        self._pid = None
+        self._tasks = None
+        self._threads = []
+
+    def submit(self, func):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._tasks = queue.Queue()
+                self._threads = []
+
+            if len(self._threads) < self._size:
+                thread = threading.Thread(
+                    target=self._work, args=(self._tasks,)
+                )
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+            self._tasks.put(func)
+
+    def _work(self, tasks):
+        while True:
+            tasks.get()()
+
+
+_worker_pool = _WorkerPool(max(_cpu_count(), 2))
+
+
+def _parallel_map(func, iterable, workers=None, max_pending=None):
+    """
+    Apply func to every item in iterable and return the results in order.
+
+    If workers is greater than one up to that many items are processed at
+    once on the threads of the shared _worker_pool. Calls into OpenSSL
+    release the GIL, so this lets CPU bound primitives use more than one
+    core, while the total number of threads stays bounded however many
+    callers there are. When max_pending is set at most that many items are
+    queued ahead of the workers; while the queue is full the caller
+    processes items itself. If any call raises, the first exception is
+    re-raised once all in-flight items have finished.
+    """
+    if workers is None or workers <= 1:
+        return [func(item) for item in iterable]
+
+    cond = threading.Condition()
+    tasks = collections.deque()
+    results = {}
+    errors = []
+    state = {"closed": False, "busy": 0}
+
+    def run(task):
+        index, item = task
+        if errors:
+            return
+
+        try:
+            results[index] = func(item)
+        except Exception:
+            errors.append(sys.exc_info())
+
+    def take():
+        # Called with cond held. The task is counted as busy until finish()
+        # so the caller can wait for it.
+        state["busy"] += 1
+        return tasks.popleft()
+
+    def finish():
+        with cond:
+            state["busy"] -= 1
+            cond.notify_all()
+
+    def runner():
+        while True:
+            with cond:
+                while not tasks and not state["closed"]:
+                    cond.wait()
+
+                if not tasks:
+                    return
+
+                task = take()
+
+            run(task)
+            finish()
+
+    for _ in range(workers):
+        _worker_pool.submit(runner)
+
+    count = 0
+    try:
+        for count, item in enumerate(iterable, 1):
+            while True:
+                with cond:
+                    if not max_pending or len(tasks) < max_pending:
+                        tasks.append((count - 1, item))
+                        cond.notify()
+                        break
+
+                    task = take()
+
+                run(task)
+                finish()
+    finally:
+        with cond:
+            state["closed"] = True
+            cond.notify_all()
+
+        # Runners may still be waiting for a shared thread, so the caller
+        # finishes the queue itself rather than waiting for them.
+        while True:
+            with cond:
+                if not tasks:
+                    while state["busy"]:
+                        cond.wait()
+                    break
+
+                task = take()
+
+            run(task)
+            finish()
+
+    if errors:
+        six.reraise(*errors[0])
+
+    return [results[index] for index in range(count)]
+
+
 class _DeprecatedValue(object):
     def __init__(self, value, message, warning_class):
         self.value = value
@@ -0,0 +1,99 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import subprocess
+import sys
+
+import pretend
+
+import pytest
+
+from cryptography.hazmat import backends
+from cryptography.hazmat.backends.multibackend import MultiBackend
+from cryptography.hazmat.backends.openssl import backend as openssl_backend
+
+
+def _modules_imported_by(statement):
+    # Run in a fresh interpreter so modules the test suite has already
+    # imported don't hide what the statement pulls in.
+    code = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "{0}\n"
+        "print('\\n'.join(sorted(set(sys.modules) - before)))\n"
+    ).format(statement)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output([sys.executable, "-c", code], env=env)
+    return output.decode("ascii").split()
+
+
+@pytest.mark.parametrize("statement", [
+    "import cryptography.hazmat.backends",
+    "import cryptography.fernet",
+])
+def test_import_does_not_load_backends(statement):
+    modules = _modules_imported_by(statement)
+    assert "pkg_resources" not in modules
+    assert "cryptography.hazmat.backends.openssl" not in modules
+
+
+def test_default_backend_loads_backends():
+    modules = _modules_imported_by(
+        "from cryptography.hazmat.backends import default_backend\n"
+        "default_backend()"
+    )
+    assert "cryptography.hazmat.backends.openssl" in modules
+
+
+class TestDefaultBackend(object):
+    def _reset(self, monkeypatch, available):
+        monkeypatch.setattr(backends, "_default_backend", None)
+        monkeypatch.setattr(backends, "_available_backends_list", available)
+        monkeypatch.delenv("CRYPTOGRAPHY_BACKEND", raising=False)
+
+    def test_single_backend_returned_directly(self, monkeypatch):
+        backend = pretend.stub(name="dummy")
+        self._reset(monkeypatch, [backend])
+        assert backends.default_backend() is backend
+        assert backends.default_backend() is backend
+
+    def test_multiple_backends(self, monkeypatch):
+        first = pretend.stub(name="first")
+        second = pretend.stub(name="second")
+        self._reset(monkeypatch, [first, second])
+        backend = backends.default_backend()
+        assert isinstance(backend, MultiBackend)
+        assert backend._backends == [first, second]
+
+    def test_pinned_builtin_backend(self, monkeypatch):
+        self._reset(monkeypatch, None)
+        monkeypatch.setenv("CRYPTOGRAPHY_BACKEND", "openssl")
+        assert backends.default_backend() is openssl_backend
+        assert backends._available_backends_list is None
+
+    def test_pinned_entry_point_backend(self, monkeypatch):
+        first = pretend.stub(name="first")
+        second = pretend.stub(name="second")
+        self._reset(monkeypatch, [first, second])
+        monkeypatch.setenv("CRYPTOGRAPHY_BACKEND", "second")
+        assert backends.default_backend() is second
+
+    def test_pinned_unavailable_builtin_backend(self, monkeypatch):
+        self._reset(monkeypatch, None)
+        monkeypatch.setitem(
+            backends._builtin_backends, "missing",
+            "cryptography.hazmat.backends.missing"
+        )
+        monkeypatch.setenv("CRYPTOGRAPHY_BACKEND", "missing")
+        with pytest.raises(ValueError):
+            backends.default_backend()
+
+    def test_pinned_unknown_backend(self, monkeypatch):
+        self._reset(monkeypatch, [pretend.stub(name="first")])
+        monkeypatch.setenv("CRYPTOGRAPHY_BACKEND", "unknown")
+        with pytest.raises(ValueError):
+            backends.default_backend()
@@ -158,6 +158,12 @@ class DummyEllipticCurveBackend(object):
             )
         )
 
+    def elliptic_curve_exchange_algorithm_supported(self, algorithm, curve):
+        return (
+            isinstance(algorithm, ec.ECDH) and
+            self.elliptic_curve_supported(curve)
+        )
+
     def generate_elliptic_curve_private_key(self, curve):
         if not self.elliptic_curve_supported(curve):
             raise UnsupportedAlgorithm(_Reasons.UNSUPPORTED_ELLIPTIC_CURVE)
@@ -397,6 +403,10 @@ class TestMultiBackend(object):
             ec.SECT283K1()
         ) is True
 
+        assert backend.elliptic_curve_exchange_algorithm_supported(
+            ec.ECDH(), ec.SECT283K1()
+        ) is True
+
         backend.generate_elliptic_curve_private_key(ec.SECT283K1())
 
         backend.load_elliptic_curve_private_numbers(
@@ -425,6 +435,10 @@ class TestMultiBackend(object):
             ec.SECT163K1()
         ) is False
 
+        assert backend.elliptic_curve_exchange_algorithm_supported(
+            ec.ECDH(), ec.SECT163K1()
+        ) is False
+
         with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_ELLIPTIC_CURVE):
             backend.generate_elliptic_curve_private_key(ec.SECT163K1())
 
@@ -490,3 +504,125 @@ class TestMultiBackend(object):
             backend.load_pem_x509_csr(b"reqdata")
         with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_X509):
             backend.load_der_x509_csr(b"reqdata")
+
+    def test_routes(self):
+        md5_backend = DummyHashBackend([hashes.MD5])
+        sha1_backend = DummyHashBackend([hashes.SHA1, hashes.MD5])
+        backend = MultiBackend([md5_backend, sha1_backend])
+        assert backend.routes == {}
+
+        hashes.Hash(hashes.SHA1(), backend=backend)
+        hashes.Hash(hashes.MD5(), backend=backend)
+        assert backend.routes == {
+            ("create_hash_ctx", hashes.SHA1): sha1_backend,
+            ("create_hash_ctx", hashes.MD5): md5_backend,
+        }
+
+        backend.clear_routes()
+        assert backend.routes == {}
+
+    def test_route_skips_other_backends(self):
+        calls = []
+
+        @utils.register_interface(HashBackend)
+        class RecordingHashBackend(DummyHashBackend):
+            def create_hash_ctx(self, algorithm):
+                calls.append(self)
+                return super(RecordingHashBackend, self).create_hash_ctx(
+                    algorithm
+                )
+
+        first = RecordingHashBackend([])
+        second = RecordingHashBackend([hashes.SHA1])
+        backend = MultiBackend([first, second])
+
+        hashes.Hash(hashes.SHA1(), backend=backend)
+        assert calls == [first, second]
+
+        hashes.Hash(hashes.SHA1(), backend=backend)
+        assert calls == [first, second, second]
+
+    def test_route_retried_when_unsupported(self):
+        supported = [(algorithms.AES, modes.CBC)]
+        first = DummyCipherBackend(supported)
+        second = DummyCipherBackend([(algorithms.AES, modes.CBC)])
+        backend = MultiBackend([first, second])
+        cipher = Cipher(
+            algorithms.AES(b"\x00" * 16),
+            modes.CBC(b"\x00" * 16),
+            backend=backend
+        )
+
+        cipher.encryptor()
+        route = (
+            "create_symmetric_encryption_ctx", algorithms.AES, 128, modes.CBC
+        )
+        assert backend.routes[route] is first
+
+        # The remembered backend stops supporting the cipher, so the
+        # others are tried and the route is updated.
+        del supported[:]
+        cipher.encryptor()
+        assert backend.routes[route] is second
+
+        del second._ciphers[:]
+        with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_CIPHER):
+            cipher.encryptor()
+
+    def test_route_per_key_size(self):
+        calls = []
+
+        @utils.register_interface(CipherBackend)
+        class KeySizeCipherBackend(DummyCipherBackend):
+            def __init__(self, key_sizes):
+                super(KeySizeCipherBackend, self).__init__(
+                    [(algorithms.AES, modes.CBC)]
+                )
+                self._key_sizes = key_sizes
+
+            def create_symmetric_encryption_ctx(self, cipher, mode):
+                calls.append(self)
+                if cipher.key_size not in self._key_sizes:
+                    raise UnsupportedAlgorithm("", _Reasons.UNSUPPORTED_CIPHER)
+
+        first = KeySizeCipherBackend([128])
+        second = KeySizeCipherBackend([128, 256])
+        backend = MultiBackend([first, second])
+
+        def encryptor(key_size):
+            Cipher(
+                algorithms.AES(b"\x00" * (key_size // 8)),
+                modes.CBC(b"\x00" * 16),
+                backend=backend
+            ).encryptor()
+
+        encryptor(256)
+        assert calls == [first, second]
+
+        # Falling back to the second backend for 256-bit keys must not take
+        # 128-bit keys away from the first.
+        del calls[:]
+        encryptor(128)
+        encryptor(256)
+        assert calls == [first, second]
+
+    def test_route_fallback_skips_remembered_backend(self):
+        calls = []
+
+        @utils.register_interface(HashBackend)
+        class RecordingHashBackend(DummyHashBackend):
+            def create_hash_ctx(self, algorithm):
+                calls.append(self)
+                return super(RecordingHashBackend, self).create_hash_ctx(
+                    algorithm
+                )
+
+        first = RecordingHashBackend([hashes.SHA1])
+        second = RecordingHashBackend([hashes.SHA1])
+        backend = MultiBackend([first, second])
+        hashes.Hash(hashes.SHA1(), backend=backend)
+
+        del first._algorithms[:]
+        del calls[:]
+        hashes.Hash(hashes.SHA1(), backend=backend)
+        assert calls == [first, second]
@@ -8,6 +8,7 @@ import os
 import subprocess
 import sys
 import textwrap
+import threading
 
 import pretend
 
@@ -17,11 +18,11 @@ from cryptography import utils
 from cryptography.exceptions import InternalError, _Reasons
 from cryptography.hazmat.backends.interfaces import RSABackend
 from cryptography.hazmat.backends.openssl.backend import (
-    Backend, backend
+    Backend, _MAX_POOLED_BN_CTX, backend
 )
 from cryptography.hazmat.backends.openssl.ec import _sn_to_elliptic_curve
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import dsa, padding
+from cryptography.hazmat.primitives.asymmetric import dsa, ec, padding
 from cryptography.hazmat.primitives.ciphers import (
     BlockCipherAlgorithm, Cipher, CipherAlgorithm
 )
@@ -214,6 +215,27 @@ class TestOpenSSL(object):
         bn = backend._int_to_bn(0)
         assert backend._bn_to_int(bn) == 0
 
+    def test_tmp_bn_ctx_is_reused(self):
+        with backend._tmp_bn_ctx() as bn_ctx:
+            pass
+
+        with backend._tmp_bn_ctx() as reused_bn_ctx:
+            assert reused_bn_ctx == bn_ctx
+            # A nested request can't share the context in use.
+            with backend._tmp_bn_ctx() as nested_bn_ctx:
+                assert nested_bn_ctx != reused_bn_ctx
+
+    def test_tmp_bn_ctx_pool_is_bounded(self):
+        contexts = [
+            backend._tmp_bn_ctx() for _ in range(_MAX_POOLED_BN_CTX * 2)
+        ]
+        for ctx in contexts:
+            ctx.__enter__()
+        for ctx in contexts:
+            ctx.__exit__(None, None, None)
+
+        assert len(backend._bn_ctx_pool) == _MAX_POOLED_BN_CTX
+
 
 class TestOpenSSLRandomEngine(object):
     def teardown_method(self, method):
@@ -486,6 +508,15 @@ class DummyLibrary(object):
     Cryptography_HAS_EC = 0
 
 
+class _LibWrapper(object):
+    def __init__(self, lib, **overrides):
+        self._lib = lib
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._lib, name)
+
+
 class TestOpenSSLEllipticCurve(object):
     def test_elliptic_curve_supported(self, monkeypatch):
         monkeypatch.setattr(backend, "_lib", DummyLibrary())
@@ -503,6 +534,201 @@ class TestOpenSSLEllipticCurve(object):
         with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_ELLIPTIC_CURVE):
             _sn_to_elliptic_curve(backend, b"fake")
 
+    def test_order_bits_cached_per_curve(self):
+        if not backend.elliptic_curve_supported(ec.SECP256R1()):
+            pytest.skip("Does not support SECP256R1.")
+
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        assert key._order_bits == 256
+        assert key.public_key()._order_bits == 256
+        nid = backend._elliptic_curve_to_nid(ec.SECP256R1())
+        assert backend._ec_order_bits[nid] == 256
+
+    def test_exchange_failure(self, monkeypatch):
+        if not backend.elliptic_curve_exchange_algorithm_supported(
+            ec.ECDH(), ec.SECP256R1()
+        ):
+            pytest.skip("Does not support ECDH on SECP256R1.")
+
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        peer = ec.generate_private_key(ec.SECP256R1(), backend).public_key()
+        monkeypatch.setattr(backend, "_lib", _LibWrapper(
+            backend._lib, ECDH_compute_key=lambda *args: -1
+        ))
+        with pytest.raises(ValueError):
+            key.exchange(ec.ECDH(), peer)
+
+
+@pytest.mark.skipif(
+    not backend.elliptic_curve_supported(ec.SECP256R1()),
+    reason="Requires SECP256R1 support."
+)
+class TestOpenSSLECPrecompute(object):
+    @pytest.fixture(autouse=True)
+    def fresh_groups(self, monkeypatch):
+        monkeypatch.setattr(backend, "_ec_precomputed_groups", {})
+        monkeypatch.setattr(backend, "_ec_precompute_threshold", None)
+
+    def _sign_and_verify(self, private_key, public_key):
+        signer = private_key.signer(ec.ECDSA(hashes.SHA256()))
+        signer.update(b"message")
+        signature = signer.finalize()
+
+        verifier = public_key.verifier(signature, ec.ECDSA(hashes.SHA256()))
+        verifier.update(b"message")
+        verifier.verify()
+
+    def _has_table(self, key):
+        group = backend._lib.EC_KEY_get0_group(key._ec_key)
+        return backend._lib.EC_GROUP_have_precompute_mult(group) == 1
+
+    def test_precompute(self):
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        public_key = private_key.public_key()
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+
+        private_key.precompute()
+        assert self._has_table(private_key)
+        assert list(backend._ec_precomputed_groups) == [
+            private_key._curve_nid
+        ]
+
+        # A second call is a no-op.
+        ec_key = private_key._ec_key
+        private_key.precompute()
+        assert private_key._ec_key == ec_key
+
+        self._sign_and_verify(private_key, public_key)
+        assert private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ) == pem
+
+    def test_table_shared_per_curve(self):
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        private_key.precompute()
+        group = backend._ec_precomputed_groups[private_key._curve_nid]
+
+        # Other keys on the curve pick up the table on their next use
+        # without building one of their own.
+        other_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        public_key = other_key.public_key()
+        assert not self._has_table(other_key)
+
+        self._sign_and_verify(other_key, public_key)
+        assert self._has_table(other_key)
+        assert self._has_table(public_key)
+        assert backend._ec_precomputed_groups == {
+            private_key._curve_nid: group
+        }
+
+    def test_automatic_precompute(self):
+        backend.set_ec_precompute_policy(threshold=2)
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        public_key = private_key.public_key()
+
+        self._sign_and_verify(private_key, public_key)
+        assert not self._has_table(public_key)
+
+        self._sign_and_verify(private_key, public_key)
+        assert self._has_table(public_key)
+        assert self._has_table(private_key)
+
+        self._sign_and_verify(private_key, public_key)
+
+    @pytest.mark.parametrize(
+        ("threshold", "exception"),
+        [
+            (0, ValueError),
+            ("1", TypeError),
+        ]
+    )
+    def test_invalid_policy(self, threshold, exception):
+        with pytest.raises(exception):
+            backend.set_ec_precompute_policy(threshold)
+
+
+@pytest.mark.skipif(
+    not backend.elliptic_curve_supported(ec.SECP256R1()),
+    reason="Requires SECP256R1 support."
+)
+class TestOpenSSLECValidation(object):
+    @pytest.fixture(autouse=True)
+    def untrusted_only(self, monkeypatch):
+        ec_validate = threading.local()
+        ec_validate.policy = "untrusted-only"
+        monkeypatch.setattr(backend, "_ec_validate", ec_validate)
+
+    def test_generate_skips_check_key(self, monkeypatch):
+        check_key = pretend.call_recorder(backend._lib.EC_KEY_check_key)
+        monkeypatch.setattr(
+            backend, "_lib",
+            _LibWrapper(backend._lib, EC_KEY_check_key=check_key)
+        )
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        assert check_key.calls == []
+
+        private_key.public_key().public_numbers().public_key(backend)
+        assert len(check_key.calls) == 1
+
+    def test_private_numbers_round_trip(self):
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        numbers = private_key.private_numbers()
+        loaded = numbers.private_key(backend)
+        assert loaded.private_numbers() == numbers
+
+        signer = loaded.signer(ec.ECDSA(hashes.SHA256()))
+        signer.update(b"message")
+        verifier = private_key.public_key().verifier(
+            signer.finalize(), ec.ECDSA(hashes.SHA256())
+        )
+        verifier.update(b"message")
+        verifier.verify()
+
+    def test_point_not_on_curve(self):
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        numbers = private_key.private_numbers()
+        bad_numbers = ec.EllipticCurvePrivateNumbers(
+            numbers.private_value,
+            ec.EllipticCurvePublicNumbers(
+                numbers.public_numbers.x,
+                numbers.public_numbers.y + 1,
+                ec.SECP256R1()
+            )
+        )
+        with pytest.raises(ValueError):
+            bad_numbers.private_key(backend)
+
+        with pytest.raises(ValueError):
+            bad_numbers.public_numbers.public_key(backend)
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            with backend.ec_validation_policy("never"):
+                pass
+
+        assert backend._ec_validation_policy() == "untrusted-only"
+
+    def test_policy_restored(self):
+        with backend.ec_validation_policy("always"):
+            assert backend._ec_validation_policy() == "always"
+
+        assert backend._ec_validation_policy() == "untrusted-only"
+
+    def test_policy_is_per_thread(self):
+        policies = []
+        thread = threading.Thread(
+            target=lambda: policies.append(backend._ec_validation_policy())
+        )
+        thread.start()
+        thread.join()
+        assert policies == ["always"]
+
 
 @pytest.mark.requires_backend_interface(interface=RSABackend)
 class TestRSAPEMSerialization(object):
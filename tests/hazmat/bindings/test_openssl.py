@@ -4,11 +4,22 @@
 
 from __future__ import absolute_import, division, print_function
 
+import pretend
+
 import pytest
 
 from cryptography.hazmat.bindings.openssl.binding import Binding
 
 
+class _LibWrapper(object):
+    def __init__(self, lib, **overrides):
+        self._lib = lib
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._lib, name)
+
+
 class TestOpenSSL(object):
     def test_binding_loads(self):
         binding = Binding()
@@ -87,6 +98,56 @@ class TestOpenSSL(object):
         assert lock.acquire(False)
         lock.release()
 
+    def test_forced_fallback_crypto_lock(self, monkeypatch):
+        b = Binding()
+        set_cb = pretend.call_recorder(lambda cb: None)
+        # Pretend nothing has set a callback and the native one is
+        # unavailable. The callback is only recorded, so the process wide
+        # OpenSSL state is left alone.
+        monkeypatch.setattr(Binding, "lib", _LibWrapper(
+            b.lib,
+            CRYPTO_get_locking_callback=lambda: b.ffi.NULL,
+            Cryptography_setup_ssl_threads=lambda: 0,
+            CRYPTO_set_locking_callback=set_cb,
+        ))
+        monkeypatch.setattr(Binding, "_locks", None)
+
+        Binding.init_static_locks()
+        assert set_cb.calls == [pretend.call(Binding._lock_cb_handle)]
+        assert len(Binding._locks) == b.lib.CRYPTO_num_locks()
+
+        lock = Binding._locks[b.lib.CRYPTO_LOCK_SSL]
+        Binding._lock_cb(b.lib.CRYPTO_LOCK | b.lib.CRYPTO_READ,
+                         b.lib.CRYPTO_LOCK_SSL, "<test>", 1)
+        assert not lock.acquire(False)
+
+        Binding._lock_cb(b.lib.CRYPTO_UNLOCK | b.lib.CRYPTO_READ,
+                         b.lib.CRYPTO_LOCK_SSL, "<test>", 1)
+        assert lock.acquire(False)
+        lock.release()
+
+    def test_native_crypto_lock(self):
+        b = Binding()
+        original_cb = b.lib.CRYPTO_get_locking_callback()
+        if b.lib.Cryptography_setup_ssl_threads() != 1:
+            pytest.skip("Native locking callback not available")
+
+        try:
+            # Installing it more than once reuses the same locks.
+            assert b.lib.Cryptography_setup_ssl_threads() == 1
+            assert b.lib.CRYPTO_get_locking_callback() != b.ffi.NULL
+
+            b.lib.CRYPTO_lock(
+                b.lib.CRYPTO_LOCK | b.lib.CRYPTO_READ,
+                b.lib.CRYPTO_LOCK_SSL, b.ffi.NULL, 0
+            )
+            b.lib.CRYPTO_lock(
+                b.lib.CRYPTO_UNLOCK | b.lib.CRYPTO_READ,
+                b.lib.CRYPTO_LOCK_SSL, b.ffi.NULL, 0
+            )
+        finally:
+            b.lib.CRYPTO_set_locking_callback(original_cb)
+
     def test_add_engine_more_than_once(self):
         b = Binding()
         res = b.lib.Cryptography_add_osrandom_engine()
@@ -4,12 +4,24 @@
 
 from __future__ import absolute_import, division, print_function
 
+import threading
+import time
+
 import pytest
 
+from cryptography.hazmat.backends.interfaces import (
+    DSABackend, EllipticCurveBackend, RSABackend
+)
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding
 from cryptography.hazmat.primitives.asymmetric.utils import (
-    decode_rfc6979_signature, encode_rfc6979_signature
+    Prehashed, decode_rfc6979_signature, encode_rfc6979_signature,
+    raw_to_rfc6979_signatures, rfc6979_to_raw_signatures, verify_many
 )
 
+from .fixtures_dsa import DSA_KEY_1024
+from .fixtures_rsa import RSA_KEY_512, RSA_KEY_512_ALT
+
 
 def test_rfc6979_signature():
     sig = encode_rfc6979_signature(1, 1)
@@ -65,6 +77,174 @@ def test_decode_rfc6979_invalid_asn1():
         decode_rfc6979_signature(b"0\x07\x02\x01\x01\x02\x02\x01")
 
     with pytest.raises(ValueError):
-        # This is the BER "end-of-contents octets," which pyasn1 is
-        # wrongly willing to return from top-level DER decoding.
+        # This is the BER "end-of-contents octets," which older ASN.1
+        # decoders were wrongly willing to return from top-level decoding.
         decode_rfc6979_signature(b"\x00\x00")
+
+
+def test_rfc6979_signature_long_form_length():
+    r = 2 ** 1000 + 1
+    s = 2 ** 999
+    sig = encode_rfc6979_signature(r, s)
+    assert sig[:4] == b"0\x82\x01\x00"
+    assert decode_rfc6979_signature(sig) == (r, s)
+
+
+def test_decode_rfc6979_truncated():
+    sig = encode_rfc6979_signature(2 ** 255, 2 ** 255)
+    for length in range(len(sig)):
+        with pytest.raises(ValueError):
+            decode_rfc6979_signature(sig[:length])
+
+
+def test_decode_rfc6979_extra_integer():
+    with pytest.raises(ValueError):
+        decode_rfc6979_signature(b"0\x09\x02\x01\x01\x02\x01\x01\x02\x01\x01")
+
+
+def test_raw_rfc6979_signatures():
+    raw = [
+        b"\x00" * 31 + b"\x01" + b"\xff" * 32,
+        b"\x80" + b"\x00" * 63,
+    ]
+    der = raw_to_rfc6979_signatures(raw)
+    assert der == [
+        encode_rfc6979_signature(1, 2 ** 256 - 1),
+        encode_rfc6979_signature(2 ** 255, 0),
+    ]
+    assert rfc6979_to_raw_signatures(der, 32) == raw
+    assert raw_to_rfc6979_signatures([]) == []
+
+
+def test_raw_to_rfc6979_invalid():
+    with pytest.raises(ValueError):
+        raw_to_rfc6979_signatures([b"\x00" * 3])
+
+    with pytest.raises(ValueError):
+        raw_to_rfc6979_signatures([b""])
+
+    with pytest.raises(TypeError):
+        raw_to_rfc6979_signatures([u"\x00\x00"])
+
+
+def test_rfc6979_to_raw_invalid():
+    with pytest.raises(ValueError):
+        rfc6979_to_raw_signatures([encode_rfc6979_signature(2 ** 256, 1)], 32)
+
+    with pytest.raises(ValueError):
+        rfc6979_to_raw_signatures([encode_rfc6979_signature(-1, 1)], 32)
+
+    with pytest.raises(ValueError):
+        rfc6979_to_raw_signatures([b"\x00\x00"], 32)
+
+    with pytest.raises(ValueError):
+        rfc6979_to_raw_signatures([], 0)
+
+    with pytest.raises(TypeError):
+        rfc6979_to_raw_signatures([], 1.5)
+
+
+def test_prehashed():
+    prehashed = Prehashed(hashes.SHA256())
+    assert prehashed.digest_size == 32
+
+
+def test_prehashed_invalid_algorithm():
+    with pytest.raises(TypeError):
+        Prehashed(hashes.SHA256)
+
+
+def _sign(private_key, data, *args):
+    signer = private_key.signer(*args)
+    signer.update(data)
+    return signer.finalize()
+
+
+@pytest.mark.requires_backend_interface(interface=RSABackend)
+class TestVerifyMany(object):
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PKCS1v15()
+        ),
+        skip_message="Does not support PKCS1v1.5."
+    )
+    @pytest.mark.parametrize("workers", [None, 4])
+    def test_rsa(self, backend, workers):
+        private_key = RSA_KEY_512.private_key(backend)
+        public_key = private_key.public_key()
+        other_private_key = RSA_KEY_512_ALT.private_key(backend)
+        other_key = other_private_key.public_key()
+        signature = _sign(
+            private_key, b"message", padding.PKCS1v15(), hashes.SHA1()
+        )
+        other_signature = _sign(
+            other_private_key, b"message", padding.PKCS1v15(), hashes.SHA1()
+        )
+
+        assert verify_many([
+            (public_key, signature, b"message", padding.PKCS1v15(),
+             hashes.SHA1()),
+            (other_key, signature, b"message", padding.PKCS1v15(),
+             hashes.SHA1()),
+            (public_key, signature, b"other", padding.PKCS1v15(),
+             hashes.SHA1()),
+            (other_key, other_signature, b"message", padding.PKCS1v15(),
+             hashes.SHA1()),
+            (public_key, other_signature, b"message", padding.PKCS1v15(),
+             hashes.SHA1()),
+            (public_key, b"\x00" * len(signature), b"message",
+             padding.PKCS1v15(), hashes.SHA1()),
+        ], workers=workers) == [True, False, False, True, False, False]
+
+    def test_mixed_key_types(self, backend):
+        if (
+            not isinstance(backend, DSABackend) or
+            not isinstance(backend, EllipticCurveBackend) or
+            not backend.elliptic_curve_supported(ec.SECP256R1())
+        ):
+            pytest.skip("Requires DSA and SECP256R1 support.")
+
+        dsa_key = DSA_KEY_1024.private_key(backend)
+        ec_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        dsa_signature = _sign(dsa_key, b"message", hashes.SHA1())
+        ec_signature = _sign(
+            ec_key, b"message", ec.ECDSA(hashes.SHA256())
+        )
+
+        assert verify_many([
+            (ec_key.public_key(), ec_signature, b"message",
+             ec.ECDSA(hashes.SHA256())),
+            (dsa_key.public_key(), dsa_signature, b"message", hashes.SHA1()),
+            (ec_key.public_key(), ec_signature, b"other",
+             ec.ECDSA(hashes.SHA256())),
+            (dsa_key.public_key(), dsa_signature, b"other", hashes.SHA1()),
+        ], workers=2) == [True, True, False, False]
+
+    def test_single_key_uses_all_workers(self, backend, monkeypatch):
+        public_key = RSA_KEY_512.private_key(backend).public_key()
+        threads = set()
+
+        def verify(signature, data, padding, algorithm):
+            threads.add(threading.current_thread())
+            time.sleep(0.01)
+
+        monkeypatch.setattr(public_key, "verify", verify)
+        items = [
+            (public_key, b"sig", b"message", padding.PKCS1v15(),
+             hashes.SHA1())
+        ] * 64
+
+        assert verify_many(items, workers=4) == [True] * 64
+        assert len(threads) > 1
+
+    def test_empty(self, backend):
+        assert verify_many([]) == []
+        assert verify_many([], workers=4) == []
+
+    def test_invalid_data(self, backend):
+        public_key = RSA_KEY_512.private_key(backend).public_key()
+        with pytest.raises(TypeError):
+            verify_many([
+                (public_key, b"sig", u"message", padding.PKCS1v15(),
+                 hashes.SHA1()),
+            ])
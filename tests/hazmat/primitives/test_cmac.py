@@ -17,7 +17,7 @@ from cryptography.hazmat.backends.interfaces import CMACBackend
 from cryptography.hazmat.primitives.ciphers.algorithms import (
     AES, ARC4, TripleDES
 )
-from cryptography.hazmat.primitives.cmac import CMAC
+from cryptography.hazmat.primitives.cmac import CMAC, CMACKey, cmac_many
 
 from ..backends.test_multibackend import DummyCMACBackend
 from ...utils import (
@@ -186,6 +186,62 @@ class TestCMAC(object):
         assert cmac.finalize() == copy_cmac.finalize()
 
 
+@pytest.mark.supported(
+    only_if=lambda backend: backend.cmac_algorithm_supported(AES(fake_key)),
+    skip_message="Does not support CMAC."
+)
+@pytest.mark.requires_backend_interface(interface=CMACBackend)
+class TestCMACKey(object):
+    @pytest.mark.parametrize("params", vectors_aes)
+    def test_aes_mac(self, backend, params):
+        key = params["key"]
+        message = params["message"]
+        output = params["output"]
+
+        cmac_key = CMACKey(AES(binascii.unhexlify(key)), backend)
+        assert binascii.hexlify(
+            cmac_key.mac(binascii.unhexlify(message))
+        ) == output
+        cmac_key.verify(
+            binascii.unhexlify(message), binascii.unhexlify(output)
+        )
+
+    def test_reuse(self, backend):
+        cmac_key = CMACKey(AES(fake_key), backend)
+        first = cmac_key.mac(b"one")
+        assert cmac_key.mac(b"two") != first
+        assert cmac_key.mac(b"one") == first
+
+    def test_new(self, backend):
+        cmac_key = CMACKey(AES(fake_key), backend)
+        c = cmac_key.new()
+        c.update(b"message")
+        assert c.finalize() == cmac_key.mac(b"message")
+
+    def test_invalid_verify(self, backend):
+        cmac_key = CMACKey(AES(fake_key), backend)
+        with pytest.raises(InvalidSignature):
+            cmac_key.verify(b"message", b"foobar")
+
+    def test_reject_unicode(self, backend):
+        cmac_key = CMACKey(AES(fake_key), backend)
+        with pytest.raises(TypeError):
+            cmac_key.mac(u"")
+
+        with pytest.raises(TypeError):
+            cmac_key.verify(b"message", u"")
+
+    def test_cmac_many(self, backend):
+        messages = [b"", b"one", b"two" * 100]
+        expected = []
+        for message in messages:
+            cmac = CMAC(AES(fake_key), backend)
+            cmac.update(message)
+            expected.append(cmac.finalize())
+
+        assert cmac_many(AES(fake_key), messages, backend) == expected
+
+
 def test_copy():
     backend = DummyCMACBackend([AES])
     copied_ctx = pretend.stub()
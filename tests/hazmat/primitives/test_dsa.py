@@ -17,7 +17,8 @@ from cryptography.hazmat.backends.interfaces import (
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import dsa
 from cryptography.hazmat.primitives.asymmetric.utils import (
-    encode_rfc6979_signature
+    Prehashed, SignatureFormat, encode_rfc6979_signature,
+    raw_to_rfc6979_signatures
 )
 from cryptography.utils import bit_length
 
@@ -660,6 +661,60 @@ class TestDSASignature(object):
         verifier.update(vector['msg'])
         verifier.verify()
 
+    def test_prehashed_sign_verify(self, backend):
+        private_key = DSA_KEY_1024.private_key(backend)
+        h = hashes.Hash(hashes.SHA1(), backend)
+        h.update(b"message")
+        digest = h.finalize()
+
+        signer = private_key.signer(Prehashed(hashes.SHA1()))
+        signer.update(digest)
+        signature = signer.finalize()
+
+        public_key = private_key.public_key()
+        verifier = public_key.verifier(signature, hashes.SHA1())
+        verifier.update(b"message")
+        verifier.verify()
+
+        verifier = public_key.verifier(signature, Prehashed(hashes.SHA1()))
+        verifier.update(digest)
+        verifier.verify()
+
+    def test_prehashed_digest_mismatch(self, backend):
+        private_key = DSA_KEY_1024.private_key(backend)
+        signer = private_key.signer(Prehashed(hashes.SHA1()))
+        signer.update(b"\x00" * 32)
+        with pytest.raises(ValueError):
+            signer.finalize()
+
+    def test_raw_signature_format(self, backend):
+        private_key = DSA_KEY_1024.private_key(backend)
+        algorithm = dsa.DSA(hashes.SHA1(), SignatureFormat.RAW)
+        assert algorithm.signature_format is SignatureFormat.RAW
+        signer = private_key.signer(algorithm)
+        signer.update(b"message")
+        signature = signer.finalize()
+        assert len(signature) == 40
+
+        public_key = private_key.public_key()
+        verifier = public_key.verifier(signature, algorithm)
+        verifier.update(b"message")
+        verifier.verify()
+
+        [der_signature] = raw_to_rfc6979_signatures([signature])
+        verifier = public_key.verifier(der_signature, hashes.SHA1())
+        verifier.update(b"message")
+        verifier.verify()
+
+        verifier = public_key.verifier(signature[:-1], algorithm)
+        verifier.update(b"message")
+        with pytest.raises(InvalidSignature):
+            verifier.verify()
+
+    def test_invalid_signature_format(self):
+        with pytest.raises(TypeError):
+            dsa.DSA(hashes.SHA1(), "RAW")
+
     def test_use_after_finalize(self, backend):
         private_key = DSA_KEY_1024.private_key(backend)
         signer = private_key.signer(hashes.SHA1())
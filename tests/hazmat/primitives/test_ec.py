@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function
 
 import itertools
 import os
+from binascii import hexlify
 
 import pytest
 
@@ -16,12 +17,14 @@ from cryptography.hazmat.backends.interfaces import (
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.asymmetric.utils import (
-    encode_rfc6979_signature
+    Prehashed, SignatureFormat, encode_rfc6979_signature,
+    raw_to_rfc6979_signatures, rfc6979_to_raw_signatures
 )
 
 from ...utils import (
     load_fips_ecdsa_key_pair_vectors, load_fips_ecdsa_signing_vectors,
-    load_vectors_from_file, raises_unsupported_algorithm
+    load_kasvs_ecdh_vectors, load_vectors_from_file,
+    raises_unsupported_algorithm
 )
 
 _HASH_TYPES = {
@@ -66,6 +69,17 @@ def _skip_curve_unsupported(backend, curve):
         )
 
 
+def _skip_exchange_algorithm_unsupported(backend, algorithm, curve):
+    if not backend.elliptic_curve_exchange_algorithm_supported(
+        algorithm, curve
+    ):
+        pytest.skip(
+            "Exchange algorithm is not supported by this backend {0}".format(
+                backend
+            )
+        )
+
+
 @utils.register_interface(ec.EllipticCurve)
 class DummyCurve(object):
     name = "dummy-curve"
@@ -267,6 +281,85 @@ class TestECDSAVectors(object):
             ec.SECP192R1()
         ) is False
 
+    def test_prehashed_sign_verify(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        h = hashes.Hash(hashes.SHA256(), backend)
+        h.update(b"message")
+        digest = h.finalize()
+
+        signer = key.signer(ec.ECDSA(Prehashed(hashes.SHA256())))
+        signer.update(digest)
+        signature = signer.finalize()
+
+        verifier = key.public_key().verifier(
+            signature, ec.ECDSA(hashes.SHA256())
+        )
+        verifier.update(b"message")
+        verifier.verify()
+
+        verifier = key.public_key().verifier(
+            signature, ec.ECDSA(Prehashed(hashes.SHA256()))
+        )
+        verifier.update(digest[:16])
+        verifier.update(digest[16:])
+        verifier.verify()
+
+    def test_prehashed_digest_mismatch(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        signer = key.signer(ec.ECDSA(Prehashed(hashes.SHA256())))
+        signer.update(b"\x00" * 20)
+        with pytest.raises(ValueError):
+            signer.finalize()
+
+    def test_raw_signature_format(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        algorithm = ec.ECDSA(hashes.SHA256(), SignatureFormat.RAW)
+        assert algorithm.signature_format is SignatureFormat.RAW
+
+        signer = key.signer(algorithm)
+        signer.update(b"message")
+        signature = signer.finalize()
+        assert len(signature) == 64
+
+        verifier = key.public_key().verifier(signature, algorithm)
+        verifier.update(b"message")
+        verifier.verify()
+
+        [der_signature] = raw_to_rfc6979_signatures([signature])
+        verifier = key.public_key().verifier(
+            der_signature, ec.ECDSA(hashes.SHA256())
+        )
+        verifier.update(b"message")
+        verifier.verify()
+
+        signer = key.signer(ec.ECDSA(hashes.SHA256()))
+        signer.update(b"message")
+        [raw_signature] = rfc6979_to_raw_signatures([signer.finalize()], 32)
+        verifier = key.public_key().verifier(raw_signature, algorithm)
+        verifier.update(b"message")
+        verifier.verify()
+
+    def test_raw_signature_invalid(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        algorithm = ec.ECDSA(hashes.SHA256(), SignatureFormat.RAW)
+        signer = key.signer(algorithm)
+        signer.update(b"message")
+        signature = signer.finalize()
+
+        for bad in (signature[:-1], signature + b"\x00", b"\x00" * 64):
+            verifier = key.public_key().verifier(bad, algorithm)
+            verifier.update(b"message")
+            with pytest.raises(exceptions.InvalidSignature):
+                verifier.verify()
+
+    def test_invalid_signature_format(self):
+        with pytest.raises(TypeError):
+            ec.ECDSA(hashes.SHA256(), "RAW")
+
     def test_load_invalid_ec_key_from_numbers(self, backend):
         _skip_curve_unsupported(backend, ec.SECP256R1())
 
@@ -723,3 +816,97 @@ class TestEllipticCurvePEMPublicKeySerialization(object):
             key.public_bytes(
                 serialization.Encoding.PEM, serialization.PublicFormat.PKCS1
             )
+
+
+@pytest.mark.requires_backend_interface(interface=EllipticCurveBackend)
+class TestECDH(object):
+    @pytest.mark.parametrize(
+        "vector",
+        load_vectors_from_file(
+            os.path.join(
+                "asymmetric", "ECDH",
+                "KASValidityTest_ECCStaticUnified_NOKC_ZZOnly_init.fax"),
+            load_kasvs_ecdh_vectors
+        )
+    )
+    def test_key_exchange_with_vectors(self, backend, vector):
+        _skip_exchange_algorithm_unsupported(
+            backend, ec.ECDH(), ec._CURVE_TYPES[vector['curve']]()
+        )
+
+        key_numbers = vector['IUT']
+        private_numbers = ec.EllipticCurvePrivateNumbers(
+            key_numbers['d'],
+            ec.EllipticCurvePublicNumbers(
+                key_numbers['x'],
+                key_numbers['y'],
+                ec._CURVE_TYPES[vector['curve']]()
+            )
+        )
+        # Errno 5-7 indicates a bad public or private key, this doesn't test
+        # the ECDH code at all
+        if vector['fail'] and vector['errno'] in [5, 6, 7]:
+            with pytest.raises(ValueError):
+                private_numbers.private_key(backend)
+            return
+        else:
+            private_key = private_numbers.private_key(backend)
+
+        peer_numbers = vector['CAVS']
+        public_numbers = ec.EllipticCurvePublicNumbers(
+            peer_numbers['x'],
+            peer_numbers['y'],
+            ec._CURVE_TYPES[vector['curve']]()
+        )
+        # Errno 1 and 2 indicates a bad public key, this doesn't test the ECDH
+        # code at all
+        if vector['fail'] and vector['errno'] in [1, 2]:
+            with pytest.raises(ValueError):
+                public_numbers.public_key(backend)
+            return
+        else:
+            peer_pubkey = public_numbers.public_key(backend)
+
+        z = private_key.exchange(ec.ECDH(), peer_pubkey)
+        z = int(hexlify(z).decode('ascii'), 16)
+        # At this point fail indicates that one of the underlying keys was
+        # changed. This results in a non-matching derived key.
+        if vector['fail']:
+            # Errno 8 indicates Z should be changed.
+            assert vector['errno'] == 8
+            assert z != vector['Z']
+        else:
+            assert z == vector['Z']
+
+    def test_exchange_is_symmetric(self, backend):
+        _skip_exchange_algorithm_unsupported(
+            backend, ec.ECDH(), ec.SECP256R1()
+        )
+
+        key1 = ec.generate_private_key(ec.SECP256R1(), backend)
+        key2 = ec.generate_private_key(ec.SECP256R1(), backend)
+        shared = key1.exchange(ec.ECDH(), key2.public_key())
+        assert len(shared) == 32
+        assert shared == key2.exchange(ec.ECDH(), key1.public_key())
+
+    def test_exchange_unsupported_algorithm(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        with raises_unsupported_algorithm(
+            exceptions._Reasons.UNSUPPORTED_EXCHANGE_ALGORITHM
+        ):
+            key.exchange(None, key.public_key())
+
+    def test_exchange_different_curves(self, backend):
+        _skip_exchange_algorithm_unsupported(
+            backend, ec.ECDH(), ec.SECP256R1()
+        )
+        _skip_exchange_algorithm_unsupported(
+            backend, ec.ECDH(), ec.SECP384R1()
+        )
+
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        peer = ec.generate_private_key(ec.SECP384R1(), backend)
+        with pytest.raises(ValueError):
+            key.exchange(ec.ECDH(), peer.public_key())
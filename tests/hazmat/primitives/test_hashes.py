@@ -62,6 +62,38 @@ class TestHashContext(object):
             hashes.Hash(UnsupportedDummyHash(), backend)
 
 
+@pytest.mark.requires_backend_interface(interface=HashBackend)
+class TestHashPrefix(object):
+    def test_digest(self, backend):
+        prefix = hashes.HashPrefix(hashes.SHA256(), b"prefix", backend)
+        h = hashes.Hash(hashes.SHA256(), backend)
+        h.update(b"prefix")
+        h.update(b"suffix")
+        assert prefix.digest(b"suffix") == h.finalize()
+        assert prefix.algorithm.name == "sha256"
+
+    def test_reuse(self, backend):
+        prefix = hashes.HashPrefix(hashes.SHA256(), b"prefix", backend)
+        first = prefix.digest(b"one")
+        assert prefix.digest(b"two") != first
+        assert prefix.digest(b"one") == first
+
+    def test_new(self, backend):
+        prefix = hashes.HashPrefix(hashes.SHA1(), b"prefix", backend)
+        h = prefix.new()
+        h.update(b"suffix")
+        assert h.finalize() == prefix.digest(b"suffix")
+
+    def test_prefix_reject_unicode(self, backend):
+        with pytest.raises(TypeError):
+            hashes.HashPrefix(hashes.SHA1(), u"\u00FC", backend)
+
+    def test_digest_reject_unicode(self, backend):
+        prefix = hashes.HashPrefix(hashes.SHA1(), b"prefix", backend)
+        with pytest.raises(TypeError):
+            prefix.digest(u"\u00FC")
+
+
 @pytest.mark.supported(
     only_if=lambda backend: backend.hash_supported(hashes.SHA1()),
     skip_message="Does not support SHA1",
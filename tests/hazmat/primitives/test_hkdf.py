@@ -198,6 +198,55 @@ class TestHKDFExpand(object):
         with pytest.raises(TypeError):
             hkdf.derive(u"first")
 
+    def test_derive_many(self, backend):
+        prk = binascii.unhexlify(
+            b"077709362c2e32df0ddc3f0dc47bba6390b6c73bb50f9c3122ec844ad7c2b3e5"
+        )
+        labels = [
+            (binascii.unhexlify(b"f0f1f2f3f4f5f6f7f8f9"), 42),
+            (b"label", 16),
+            (None, 100),
+        ]
+        hkdf = HKDFExpand(hashes.SHA256(), 32, None, backend)
+
+        okms = hkdf.derive_many(prk, labels)
+
+        assert okms == [
+            HKDFExpand(hashes.SHA256(), length, info, backend).derive(prk)
+            for info, length in labels
+        ]
+        assert binascii.hexlify(okms[0]) == (
+            b"3cb25f25faacd57a90434f64d0362f2a2d2d0a90cf1a5a4c5db02d56ecc4c"
+            b"5bf34007208d5b887185865"
+        )
+
+    def test_derive_many_already_finalized(self, backend):
+        hkdf = HKDFExpand(hashes.SHA256(), 42, None, backend)
+
+        hkdf.derive_many(b"first", [(b"label", 16)])
+
+        with pytest.raises(AlreadyFinalized):
+            hkdf.derive_many(b"second", [(b"label", 16)])
+
+        with pytest.raises(AlreadyFinalized):
+            hkdf.derive(b"second")
+
+    def test_derive_many_invalid_labels(self, backend):
+        big_length = 255 * (hashes.SHA256().digest_size // 8) + 1
+        hkdf = HKDFExpand(hashes.SHA256(), 42, None, backend)
+
+        with pytest.raises(ValueError):
+            hkdf.derive_many(b"prk", [(b"label", big_length)])
+
+        with pytest.raises(TypeError):
+            hkdf.derive_many(b"prk", [(u"label", 16)])
+
+        with pytest.raises(TypeError):
+            hkdf.derive_many(u"prk", [(b"label", 16)])
+
+        # Invalid labels don't use up the instance.
+        assert len(hkdf.derive_many(b"prk", [(b"label", 16)])[0]) == 16
+
 
 def test_invalid_backend():
     pretend_backend = object()
@@ -98,6 +98,86 @@ class TestHMAC(object):
             hmac.HMAC(b"key", UnsupportedDummyHash(), backend)
 
 
+@pytest.mark.requires_backend_interface(interface=HMACBackend)
+class TestHMACKey(object):
+    def test_mac(self, backend):
+        key = hmac.HMACKey(b"key", hashes.SHA256(), backend)
+        h = hmac.HMAC(b"key", hashes.SHA256(), backend)
+        h.update(b"message")
+        assert key.mac(b"message") == h.finalize()
+        assert key.algorithm.name == "sha256"
+
+    def test_reuse(self, backend):
+        key = hmac.HMACKey(b"key", hashes.SHA1(), backend)
+        first = key.mac(b"one")
+        assert key.mac(b"two") != first
+        assert key.mac(b"one") == first
+
+    def test_new(self, backend):
+        key = hmac.HMACKey(b"key", hashes.SHA1(), backend)
+        h = key.new()
+        h.update(b"message")
+        assert h.finalize() == key.mac(b"message")
+
+    def test_verify(self, backend):
+        key = hmac.HMACKey(b"key", hashes.SHA1(), backend)
+        key.verify(b"message", key.mac(b"message"))
+
+    def test_invalid_verify(self, backend):
+        key = hmac.HMACKey(b"key", hashes.SHA1(), backend)
+        with pytest.raises(InvalidSignature):
+            key.verify(b"message", key.mac(b"other message"))
+
+    def test_reject_unicode(self, backend):
+        key = hmac.HMACKey(b"key", hashes.SHA1(), backend)
+        with pytest.raises(TypeError):
+            key.mac(u"\u00FC")
+
+        with pytest.raises(TypeError):
+            key.verify(b"message", u"\u00FC")
+
+    def test_unsupported_hash(self, backend):
+        with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_HASH):
+            hmac.HMACKey(b"key", UnsupportedDummyHash(), backend)
+
+
+@pytest.mark.requires_backend_interface(interface=HMACBackend)
+class TestVerifyMany(object):
+    @pytest.mark.parametrize("workers", [None, 4])
+    def test_verify_many(self, backend, workers):
+        items = []
+        expected = []
+        for i in range(20):
+            key = b"key" + str(i % 3).encode("ascii")
+            data = b"message" + str(i).encode("ascii")
+            tag = hmac.HMACKey(key, hashes.SHA256(), backend).mac(data)
+            if i % 4 == 0:
+                tag = tag[:-1] + b"\x00"
+            items.append((key, hashes.SHA256(), data, tag))
+            expected.append(
+                hmac.HMACKey(key, hashes.SHA256(), backend).mac(data) == tag
+            )
+
+        assert hmac.verify_many(items, backend, workers=workers) == expected
+
+    def test_mixed_algorithms(self, backend):
+        sha1_tag = hmac.HMACKey(b"key", hashes.SHA1(), backend).mac(b"data")
+        items = [
+            (b"key", hashes.SHA1(), b"data", sha1_tag),
+            (b"key", hashes.SHA256(), b"data", sha1_tag),
+        ]
+        assert hmac.verify_many(items, backend) == [True, False]
+
+    def test_empty(self, backend):
+        assert hmac.verify_many([], backend) == []
+
+    def test_reject_unicode(self, backend):
+        with pytest.raises(TypeError):
+            hmac.verify_many(
+                [(b"key", hashes.SHA1(), u"\u00FC", b"tag")], backend
+            )
+
+
 def test_invalid_backend():
     pretend_backend = object()
 
@@ -0,0 +1,257 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import pretend
+
+import pytest
+
+from cryptography.exceptions import _Reasons
+from cryptography.hazmat.backends.interfaces import (
+    EllipticCurveBackend, RSABackend
+)
+from cryptography.hazmat.primitives.asymmetric import ec, keypool, rsa
+from cryptography.hazmat.primitives.asymmetric.keypool import (
+    EllipticCurveKeyPool, RSAKeyPool
+)
+
+from .test_ec import DummyCurve
+from ...utils import raises_unsupported_algorithm
+
+
+@pytest.mark.requires_backend_interface(interface=RSABackend)
+class TestRSAKeyPool(object):
+    def test_get(self, backend):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=2)
+        try:
+            assert pool.fill(timeout=60)
+            assert pool.depth == 2
+
+            key = pool.get()
+            assert isinstance(key, rsa.RSAPrivateKey)
+            assert key.key_size == 512
+            assert key.private_numbers().public_numbers.e == 65537
+            assert pool.hits == 1
+            assert pool.misses == 0
+
+            assert pool.fill(timeout=60)
+            assert pool.generated >= 3
+            assert pool.generation_time > 0
+        finally:
+            pool.close()
+
+    def test_keys_are_distinct(self, backend):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=3, workers=2)
+        try:
+            pool.fill(timeout=60)
+            moduli = set(
+                pool.get().private_numbers().public_numbers.n
+                for _ in range(5)
+            )
+            assert len(moduli) == 5
+        finally:
+            pool.close()
+
+    def test_get_after_close(self, backend):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=1)
+        pool.close()
+        assert pool.depth == 0
+        with pytest.raises(ValueError):
+            pool.get()
+
+    def test_spill_and_load(self, backend):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=2)
+        try:
+            pool.fill(timeout=60)
+            data = pool.spill(b"password")
+        finally:
+            pool.close()
+
+        restored = RSAKeyPool(65537, 512, backend, target_depth=2)
+        try:
+            assert restored.load(data, b"password") == 2
+            assert restored.depth >= 2
+            assert restored.get().key_size == 512
+        finally:
+            restored.close()
+
+        mismatched = RSAKeyPool(3, 512, backend, target_depth=1)
+        try:
+            with pytest.raises(ValueError):
+                mismatched.load(data, b"password")
+        finally:
+            mismatched.close()
+
+    def test_worker_survives_failure(self, backend, monkeypatch):
+        monkeypatch.setattr(keypool, "_RETRY_DELAY", 0.01)
+        error = ValueError("generation failed")
+
+        class FailingRSAKeyPool(RSAKeyPool):
+            failed = False
+
+            def _generate_key(self):
+                if not FailingRSAKeyPool.failed:
+                    FailingRSAKeyPool.failed = True
+                    raise error
+                return super(FailingRSAKeyPool, self)._generate_key()
+
+        pool = FailingRSAKeyPool(65537, 512, backend, target_depth=2)
+        try:
+            assert pool.fill(timeout=60)
+            assert pool.failures == 1
+            assert pool.last_error is error
+            assert pool.hits == 0
+        finally:
+            pool.close()
+
+    def test_discards_keys_after_fork(self, backend, monkeypatch):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=2)
+        try:
+            assert pool.fill(timeout=60)
+            parent_moduli = set(
+                key.private_numbers().public_numbers.n for key in pool._keys
+            )
+
+            # Simulate being the child of a fork.
+            monkeypatch.setattr(keypool.os, "getpid", lambda: -1)
+            assert pool.fill(timeout=60)
+            child_moduli = set(
+                pool.get().private_numbers().public_numbers.n
+                for _ in range(2)
+            )
+            assert not parent_moduli & child_moduli
+        finally:
+            pool.close()
+
+    def test_fork_reset_runs_once(self, backend, monkeypatch):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=1)
+        try:
+            start = pretend.call_recorder(pool._start)
+            monkeypatch.setattr(pool, "_start", start)
+
+            # Simulate being the child of a fork, with several threads
+            # noticing at once.
+            monkeypatch.setattr(keypool.os, "getpid", lambda: -1)
+            threads = [
+                threading.Thread(target=lambda: pool.depth)
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(start.calls) == 1
+            assert pool._pid == -1
+        finally:
+            pool.close()
+
+    def test_spill_invalid_types(self, backend):
+        pool = RSAKeyPool(65537, 512, backend, target_depth=1)
+        try:
+            with pytest.raises(TypeError):
+                pool.spill(u"password")
+
+            with pytest.raises(TypeError):
+                pool.load(u"data", b"password")
+        finally:
+            pool.close()
+
+    @pytest.mark.parametrize(
+        ("kwargs", "exception"),
+        [
+            ({"target_depth": 0}, ValueError),
+            ({"target_depth": 1.5}, TypeError),
+            ({"target_depth": 1, "workers": 0}, ValueError),
+            ({"target_depth": 1, "workers": "2"}, TypeError),
+        ]
+    )
+    def test_invalid_arguments(self, backend, kwargs, exception):
+        with pytest.raises(exception):
+            RSAKeyPool(65537, 512, backend, **kwargs)
+
+    def test_invalid_rsa_parameters(self, backend):
+        with pytest.raises(ValueError):
+            RSAKeyPool(65537, 256, backend, target_depth=1)
+
+
+@pytest.mark.requires_backend_interface(interface=EllipticCurveBackend)
+class TestEllipticCurveKeyPool(object):
+    def test_get(self, backend):
+        if not backend.elliptic_curve_supported(ec.SECP256R1()):
+            pytest.skip("Does not support SECP256R1.")
+
+        pool = EllipticCurveKeyPool(ec.SECP256R1(), backend, target_depth=4)
+        try:
+            assert pool.fill(timeout=60)
+            key = pool.get()
+            assert isinstance(key, ec.EllipticCurvePrivateKey)
+            assert key.curve.name == "secp256r1"
+            assert pool.hits == 1
+        finally:
+            pool.close()
+
+    def test_spill_and_load(self, backend):
+        if (
+            not backend.elliptic_curve_supported(ec.SECP256R1()) or
+            not backend.elliptic_curve_supported(ec.SECP384R1())
+        ):
+            pytest.skip("Does not support SECP256R1 and SECP384R1.")
+
+        pool = EllipticCurveKeyPool(ec.SECP256R1(), backend, target_depth=2)
+        try:
+            pool.fill(timeout=60)
+            data = pool.spill(b"password")
+        finally:
+            pool.close()
+
+        mismatched = EllipticCurveKeyPool(
+            ec.SECP384R1(), backend, target_depth=1
+        )
+        try:
+            with pytest.raises(ValueError):
+                mismatched.load(data, b"password")
+        finally:
+            mismatched.close()
+
+    def test_discards_keys_after_fork(self, backend, monkeypatch):
+        if not backend.elliptic_curve_supported(ec.SECP256R1()):
+            pytest.skip("Does not support SECP256R1.")
+
+        pool = EllipticCurveKeyPool(ec.SECP256R1(), backend, target_depth=4)
+        try:
+            assert pool.fill(timeout=60)
+            parent_values = set(
+                key.private_numbers().private_value for key in pool._keys
+            )
+
+            # A child reusing the parent's ephemeral keys would lose forward
+            # secrecy, so it must start with fresh ones.
+            monkeypatch.setattr(keypool.os, "getpid", lambda: -1)
+            assert pool.fill(timeout=60)
+            child_values = set(
+                pool.get().private_numbers().private_value for _ in range(4)
+            )
+            assert not parent_values & child_values
+        finally:
+            pool.close()
+
+    def test_unsupported_curve(self, backend):
+        with raises_unsupported_algorithm(
+            _Reasons.UNSUPPORTED_ELLIPTIC_CURVE
+        ):
+            EllipticCurveKeyPool(DummyCurve(), backend, target_depth=1)
+
+
+def test_invalid_backend():
+    pretend_backend = object()
+
+    with raises_unsupported_algorithm(_Reasons.BACKEND_MISSING_INTERFACE):
+        RSAKeyPool(65537, 2048, pretend_backend, target_depth=1)
+
+    with raises_unsupported_algorithm(_Reasons.BACKEND_MISSING_INTERFACE):
+        EllipticCurveKeyPool(ec.SECP256R1(), pretend_backend, target_depth=1)
@@ -12,7 +12,7 @@ from cryptography.exceptions import (
 )
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC, derive_many
 
 from ...utils import raises_unsupported_algorithm
 
@@ -68,3 +68,43 @@ def test_invalid_backend():
 
     with raises_unsupported_algorithm(_Reasons.BACKEND_MISSING_INTERFACE):
         PBKDF2HMAC(hashes.SHA1(), 20, b"salt", 10, pretend_backend)
+
+
+class TestDeriveMany(object):
+    @pytest.mark.parametrize(
+        ("workers", "max_pending"), [(None, None), (4, None), (2, 1)]
+    )
+    def test_derive_many(self, workers, max_pending):
+        items = [
+            (b"salt" + str(i).encode("ascii"), b"password" + b"!" * i)
+            for i in range(10)
+        ]
+        keys = derive_many(
+            hashes.SHA1(), 20, items, 10, default_backend(),
+            workers=workers, max_pending=max_pending
+        )
+        assert keys == [
+            PBKDF2HMAC(
+                hashes.SHA1(), 20, salt, 10, default_backend()
+            ).derive(password)
+            for salt, password in items
+        ]
+
+    def test_empty(self):
+        assert derive_many(
+            hashes.SHA1(), 20, [], 10, default_backend(), workers=2
+        ) == []
+
+    def test_unsupported_algorithm(self):
+        with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_HASH):
+            derive_many(
+                DummyHash(), 20, [(b"salt", b"password")], 10,
+                default_backend(), workers=2
+            )
+
+    def test_unicode_error_with_password(self):
+        with pytest.raises(TypeError):
+            derive_many(
+                hashes.SHA1(), 20, [(b"salt", u"\u00FC")], 10,
+                default_backend()
+            )
@@ -13,7 +13,7 @@ import pytest
 
 from cryptography import utils
 from cryptography.exceptions import (
-    AlreadyFinalized, InvalidSignature, _Reasons
+    AlreadyFinalized, InvalidSignature, UnsupportedAlgorithm, _Reasons
 )
 from cryptography.hazmat.backends.interfaces import (
     PEMSerializationBackend, RSABackend
@@ -23,6 +23,7 @@ from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.primitives.asymmetric.rsa import (
     RSAPrivateNumbers, RSAPublicNumbers
 )
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 
 from .fixtures_rsa import (
     RSA_KEY_1024, RSA_KEY_1025, RSA_KEY_1026, RSA_KEY_1027, RSA_KEY_1028,
@@ -787,6 +788,207 @@ class TestRSAVerification(object):
             verifier.verify()
 
 
+@pytest.mark.requires_backend_interface(interface=RSABackend)
+class TestRSAOneShot(object):
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PKCS1v15()
+        ),
+        skip_message="Does not support PKCS1v1.5."
+    )
+    @pytest.mark.parametrize(
+        "pkcs1_example",
+        _flatten_pkcs1_examples(load_vectors_from_file(
+            os.path.join(
+                "asymmetric", "RSA", "pkcs1v15sign-vectors.txt"),
+            load_pkcs1_vectors
+        ))
+    )
+    def test_pkcs1v15_sign_verify(self, pkcs1_example, backend):
+        private, public, example = pkcs1_example
+        private_key = rsa.RSAPrivateNumbers(
+            p=private["p"],
+            q=private["q"],
+            d=private["private_exponent"],
+            dmp1=private["dmp1"],
+            dmq1=private["dmq1"],
+            iqmp=private["iqmp"],
+            public_numbers=rsa.RSAPublicNumbers(
+                e=private["public_exponent"],
+                n=private["modulus"]
+            )
+        ).private_key(backend)
+        message = binascii.unhexlify(example["message"])
+        signature = private_key.sign(
+            message, padding.PKCS1v15(), hashes.SHA1()
+        )
+        assert binascii.hexlify(signature) == example["signature"]
+        private_key.public_key().verify(
+            signature, message, padding.PKCS1v15(), hashes.SHA1()
+        )
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA1()),
+                salt_length=padding.PSS.MAX_LENGTH
+            )
+        ),
+        skip_message="Does not support PSS."
+    )
+    def test_pss_sign_verify_reuse(self, backend):
+        private_key = RSA_KEY_512.private_key(backend)
+        public_key = private_key.public_key()
+        pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA1()),
+            salt_length=padding.PSS.MAX_LENGTH
+        )
+        for message in [b"one", b"two", b"one"]:
+            signature = private_key.sign(message, pss, hashes.SHA1())
+            public_key.verify(signature, message, pss, hashes.SHA1())
+
+            verifier = public_key.verifier(signature, pss, hashes.SHA1())
+            verifier.update(message)
+            verifier.verify()
+
+            with pytest.raises(InvalidSignature):
+                public_key.verify(signature, b"other", pss, hashes.SHA1())
+
+        # A different salt length needs a differently configured context.
+        pss = padding.PSS(mgf=padding.MGF1(hashes.SHA1()), salt_length=0)
+        signature = private_key.sign(b"one", pss, hashes.SHA1())
+        assert signature == private_key.sign(b"one", pss, hashes.SHA1())
+        public_key.verify(signature, b"one", pss, hashes.SHA1())
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PKCS1v15()
+        ),
+        skip_message="Does not support PKCS1v1.5."
+    )
+    def test_wrong_key(self, backend):
+        private_key = RSA_KEY_512.private_key(backend)
+        public_key = RSA_KEY_512_ALT.private_key(backend).public_key()
+        signature = private_key.sign(
+            b"sign me", padding.PKCS1v15(), hashes.SHA1()
+        )
+        with pytest.raises(InvalidSignature):
+            public_key.verify(
+                signature, b"sign me", padding.PKCS1v15(), hashes.SHA1()
+            )
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PKCS1v15()
+        ),
+        skip_message="Does not support PKCS1v1.5."
+    )
+    def test_prehashed_pkcs1v15(self, backend):
+        private_key = RSA_KEY_512.private_key(backend)
+        public_key = private_key.public_key()
+        h = hashes.Hash(hashes.SHA1(), backend)
+        h.update(b"sign me")
+        digest = h.finalize()
+
+        try:
+            signature = private_key.sign(
+                digest, padding.PKCS1v15(), Prehashed(hashes.SHA1())
+            )
+        except UnsupportedAlgorithm:
+            pytest.skip("Prehashed PKCS1v15 is not supported.")
+
+        assert signature == private_key.sign(
+            b"sign me", padding.PKCS1v15(), hashes.SHA1()
+        )
+        public_key.verify(
+            signature, digest, padding.PKCS1v15(), Prehashed(hashes.SHA1())
+        )
+        public_key.verify(
+            signature, b"sign me", padding.PKCS1v15(), hashes.SHA1()
+        )
+
+        signer = private_key.signer(
+            padding.PKCS1v15(), Prehashed(hashes.SHA1())
+        )
+        signer.update(digest)
+        assert signer.finalize() == signature
+
+        with pytest.raises(ValueError):
+            private_key.sign(
+                b"sign me", padding.PKCS1v15(), Prehashed(hashes.SHA1())
+            )
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA1()),
+                salt_length=padding.PSS.MAX_LENGTH
+            )
+        ),
+        skip_message="Does not support PSS."
+    )
+    def test_prehashed_pss(self, backend):
+        private_key = RSA_KEY_512.private_key(backend)
+        public_key = private_key.public_key()
+        pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA1()),
+            salt_length=padding.PSS.MAX_LENGTH
+        )
+        h = hashes.Hash(hashes.SHA1(), backend)
+        h.update(b"sign me")
+        digest = h.finalize()
+
+        signature = private_key.sign(digest, pss, Prehashed(hashes.SHA1()))
+        public_key.verify(signature, b"sign me", pss, hashes.SHA1())
+
+        verifier = public_key.verifier(
+            signature, pss, Prehashed(hashes.SHA1())
+        )
+        verifier.update(digest)
+        verifier.verify()
+
+    def test_unsupported_padding(self, backend):
+        private_key = RSA_KEY_512.private_key(backend)
+        public_key = private_key.public_key()
+        for _ in range(2):
+            with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_PADDING):
+                private_key.sign(b"sign me", DummyPadding(), hashes.SHA1())
+            with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_PADDING):
+                public_key.verify(
+                    b"sig", b"sign me", DummyPadding(), hashes.SHA1()
+                )
+
+    def test_padding_incorrect_type(self, backend):
+        private_key = RSA_KEY_512.private_key(backend)
+        with pytest.raises(TypeError):
+            private_key.sign(b"sign me", "notpadding", hashes.SHA1())
+        with pytest.raises(TypeError):
+            private_key.public_key().verify(
+                b"sig", b"sign me", "notpadding", hashes.SHA1()
+            )
+
+    def test_signature_not_bytes(self, backend):
+        public_key = RSA_KEY_512.private_key(backend).public_key()
+        with pytest.raises(TypeError):
+            public_key.verify(
+                u"sig", b"sign me", padding.PKCS1v15(), hashes.SHA1()
+            )
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PKCS1v15()
+        ),
+        skip_message="Does not support PKCS1v1.5."
+    )
+    def test_digest_too_large_for_key_size(self, backend):
+        private_key = RSA_KEY_599.private_key(backend)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                private_key.sign(
+                    b"failure coming", padding.PKCS1v15(), hashes.SHA512()
+                )
+
+
 @pytest.mark.requires_backend_interface(interface=RSABackend)
 class TestRSAPSSMGF1Verification(object):
     test_rsa_pss_mgf1_sha1 = pytest.mark.supported(
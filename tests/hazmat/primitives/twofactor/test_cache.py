@@ -0,0 +1,88 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from cryptography.hazmat.backends.interfaces import HMACBackend
+from cryptography.hazmat.primitives.hashes import SHA1, SHA256
+from cryptography.hazmat.primitives.twofactor.cache import (
+    OTPCache, default_cache
+)
+from cryptography.hazmat.primitives.twofactor.hotp import HOTP
+from cryptography.hazmat.primitives.twofactor.totp import TOTP
+
+
+@pytest.mark.requires_backend_interface(interface=HMACBackend)
+class TestOTPCache(object):
+    def test_hotp(self, backend):
+        cache = OTPCache(10)
+        secret = b"12345678901234567890"
+        hotp = cache.hotp(secret, 6, SHA1(), backend)
+
+        assert isinstance(hotp, HOTP)
+        assert hotp.generate(0) == b"755224"
+        assert cache.hotp(secret, 6, SHA1(), backend) is hotp
+        assert cache.hotp(secret, 8, SHA1(), backend) is not hotp
+        assert cache.hotp(secret, 6, SHA256(), backend) is not hotp
+        assert len(cache) == 3
+
+    def test_totp(self, backend):
+        cache = OTPCache(10)
+        secret = b"12345678901234567890"
+        totp = cache.totp(secret, 8, SHA1(), 30, backend)
+
+        assert isinstance(totp, TOTP)
+        assert totp.generate(59) == b"94287082"
+        assert cache.totp(secret, 8, SHA1(), 30, backend) is totp
+        assert cache.totp(secret, 8, SHA1(), 60, backend) is not totp
+        assert cache.hotp(secret, 8, SHA1(), backend) is not totp
+
+    def test_least_recently_used_evicted(self, backend):
+        cache = OTPCache(2)
+        first = cache.hotp(b"1" * 20, 6, SHA1(), backend)
+        second = cache.hotp(b"2" * 20, 6, SHA1(), backend)
+        assert cache.hotp(b"1" * 20, 6, SHA1(), backend) is first
+
+        cache.hotp(b"3" * 20, 6, SHA1(), backend)
+        assert len(cache) == 2
+        assert cache.hotp(b"1" * 20, 6, SHA1(), backend) is first
+        assert cache.hotp(b"2" * 20, 6, SHA1(), backend) is not second
+
+    def test_repeated_hits(self, backend):
+        cache = OTPCache(2)
+        hotp = cache.hotp(b"1" * 20, 6, SHA1(), backend)
+        for _ in range(10):
+            assert cache.hotp(b"1" * 20, 6, SHA1(), backend) is hotp
+
+        assert len(cache._order) <= 4
+
+    def test_clear(self, backend):
+        cache = OTPCache(2)
+        cache.hotp(b"1" * 20, 6, SHA1(), backend)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_parameters_not_cached(self, backend):
+        cache = OTPCache(2)
+        with pytest.raises(ValueError):
+            cache.hotp(b"short", 6, SHA1(), backend)
+
+        assert len(cache) == 0
+
+    def test_key_must_be_bytes(self, backend):
+        with pytest.raises(TypeError):
+            OTPCache(2).hotp(u"12345678901234567890", 6, SHA1(), backend)
+
+    def test_default_cache(self):
+        assert isinstance(default_cache, OTPCache)
+
+
+def test_invalid_max_entries():
+    with pytest.raises(TypeError):
+        OTPCache(1.5)
+
+    with pytest.raises(ValueError):
+        OTPCache(0)
@@ -86,6 +86,32 @@ class TestHOTP(object):
         with pytest.raises(InvalidToken):
             hotp.verify(b"123456", counter)
 
+    def test_verify_window(self, backend):
+        secret = b"12345678901234567890"
+
+        hotp = HOTP(secret, 6, SHA1(), backend)
+
+        assert hotp.verify_window(hotp.generate(5), 5, 0) == 5
+        assert hotp.verify_window(hotp.generate(5), 2, 3) == 5
+        assert hotp.verify_window(hotp.generate(3), 2, 3) == 3
+
+        with pytest.raises(InvalidToken):
+            hotp.verify_window(hotp.generate(6), 2, 3)
+
+        with pytest.raises(InvalidToken):
+            hotp.verify_window(hotp.generate(1), 2, 3)
+
+    def test_invalid_look_ahead(self, backend):
+        secret = b"12345678901234567890"
+
+        hotp = HOTP(secret, 6, SHA1(), backend)
+
+        with pytest.raises(ValueError):
+            hotp.verify_window(b"123456", 0, -1)
+
+        with pytest.raises(TypeError):
+            hotp.verify_window(b"123456", 0, b"foo")
+
     def test_length_not_int(self, backend):
         secret = b"12345678901234567890"
 
@@ -0,0 +1,125 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import pytest
+
+from cryptography.hazmat.primitives.twofactor import InvalidToken
+from cryptography.hazmat.primitives.twofactor.replay import (
+    MemoryReplayStorage, ReplayCache
+)
+
+
+class TestMemoryReplayStorage(object):
+    def test_add(self):
+        storage = MemoryReplayStorage(10)
+        assert storage.add(("alice", 1), 30) is True
+        assert storage.add(("alice", 1), 30) is False
+        assert storage.add(("alice", 2), 30) is True
+        assert storage.add(("bob", 1), 30) is True
+        assert len(storage) == 3
+
+    def test_evict(self):
+        storage = MemoryReplayStorage(10)
+        storage.add(("alice", 1), 30)
+        storage.add(("alice", 2), 60)
+
+        storage.evict(29)
+        assert len(storage) == 2
+
+        storage.evict(30)
+        assert len(storage) == 1
+        assert storage.add(("alice", 1), 90) is True
+        assert storage.add(("alice", 2), 90) is False
+
+    def test_max_entries(self):
+        storage = MemoryReplayStorage(2)
+        assert storage.add(("alice", 1), 30) is True
+        assert storage.add(("alice", 2), 30) is True
+        assert storage.add(("alice", 3), 30) is False
+
+        assert len(storage) == 2
+        assert storage.add(("alice", 1), 30) is False
+
+        storage.evict(30)
+        assert storage.add(("alice", 3), 60) is True
+
+    def test_evict_out_of_order(self):
+        storage = MemoryReplayStorage(10)
+        storage.add(("alice", 1), 60)
+        storage.add(("alice", 2), 30)
+        storage.add(("bob", 1), 30)
+
+        storage.evict(30)
+        assert len(storage) == 1
+        assert storage.add(("alice", 1), 90) is False
+        assert storage.add(("alice", 2), 90) is True
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            MemoryReplayStorage(0)
+
+        with pytest.raises(TypeError):
+            MemoryReplayStorage(b"foo")
+
+
+class TestReplayCache(object):
+    def test_use(self):
+        cache = ReplayCache(90, MemoryReplayStorage(10))
+        cache.use("alice", 1, 0)
+        cache.use("bob", 1, 0)
+
+        with pytest.raises(InvalidToken):
+            cache.use("alice", 1, 60)
+
+    def test_expiry(self):
+        cache = ReplayCache(90, MemoryReplayStorage(10))
+        cache.use("alice", 1, 0)
+
+        with pytest.raises(InvalidToken):
+            cache.use("alice", 1, 89)
+
+        cache.use("alice", 1, 90)
+
+    def test_threads(self):
+        cache = ReplayCache(90, MemoryReplayStorage(1000))
+        accepted = []
+
+        def use():
+            try:
+                cache.use("alice", 1, 0)
+                accepted.append(True)
+            except InvalidToken:
+                pass
+
+        threads = [threading.Thread(target=use) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert accepted == [True]
+
+    def test_full(self):
+        cache = ReplayCache(90, MemoryReplayStorage(1))
+        cache.use("alice", 1, 0)
+
+        with pytest.raises(InvalidToken):
+            cache.use("bob", 1, 10)
+
+        with pytest.raises(InvalidToken):
+            cache.use("alice", 1, 10)
+
+        cache.use("bob", 1, 90)
+
+    def test_invalid_storage(self):
+        with pytest.raises(TypeError):
+            ReplayCache(90, object())
+
+    def test_invalid_ttl(self):
+        with pytest.raises(ValueError):
+            ReplayCache(0, MemoryReplayStorage(10))
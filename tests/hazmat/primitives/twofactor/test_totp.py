@@ -10,7 +10,7 @@ from cryptography.exceptions import _Reasons
 from cryptography.hazmat.backends.interfaces import HMACBackend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.twofactor import InvalidToken
-from cryptography.hazmat.primitives.twofactor.totp import TOTP
+from cryptography.hazmat.primitives.twofactor.totp import TOTP, verify_many
 
 from ....utils import (
     load_nist_vectors, load_vectors_from_file, raises_unsupported_algorithm
@@ -77,7 +77,7 @@ class TestTOTP(object):
 
         totp = TOTP(secret, 8, hashes.SHA1(), 30, backend)
 
-        assert totp.verify(totp_value, time) is None
+        assert totp.verify(totp_value, time) == time // 30
 
     @pytest.mark.supported(
         only_if=lambda backend: backend.hmac_supported(hashes.SHA256()),
@@ -92,7 +92,7 @@ class TestTOTP(object):
 
         totp = TOTP(secret, 8, hashes.SHA256(), 30, backend)
 
-        assert totp.verify(totp_value, time) is None
+        assert totp.verify(totp_value, time) == time // 30
 
     @pytest.mark.supported(
         only_if=lambda backend: backend.hmac_supported(hashes.SHA512()),
@@ -107,7 +107,7 @@ class TestTOTP(object):
 
         totp = TOTP(secret, 8, hashes.SHA512(), 30, backend)
 
-        assert totp.verify(totp_value, time) is None
+        assert totp.verify(totp_value, time) == time // 30
 
     def test_invalid_verify(self, backend):
         secret = b"12345678901234567890"
@@ -118,6 +118,41 @@ class TestTOTP(object):
         with pytest.raises(InvalidToken):
             totp.verify(b"12345678", time)
 
+    def test_verify_window(self, backend):
+        secret = b"12345678901234567890"
+        time = 1111111109
+
+        totp = TOTP(secret, 8, hashes.SHA1(), 30, backend)
+        totp_value = totp.generate(time)
+
+        assert totp.verify(totp_value, time + 30, window=1) == time // 30
+        assert totp.verify(totp_value, time - 30, window=1) == time // 30
+        assert totp.verify(totp_value, time - 60, window=2) == time // 30
+
+        with pytest.raises(InvalidToken):
+            totp.verify(totp_value, time + 30)
+
+        with pytest.raises(InvalidToken):
+            totp.verify(totp_value, time + 60, window=1)
+
+    def test_verify_window_near_epoch(self, backend):
+        secret = b"12345678901234567890"
+
+        totp = TOTP(secret, 8, hashes.SHA1(), 30, backend)
+
+        assert totp.verify(totp.generate(0), 0, window=3) == 0
+
+    def test_invalid_window(self, backend):
+        secret = b"12345678901234567890"
+
+        totp = TOTP(secret, 8, hashes.SHA1(), 30, backend)
+
+        with pytest.raises(ValueError):
+            totp.verify(b"12345678", 59, window=-1)
+
+        with pytest.raises(TypeError):
+            totp.verify(b"12345678", 59, window=1.5)
+
     def test_floating_point_time_generate(self, backend):
         secret = b"12345678901234567890"
         time = 59.1
@@ -140,6 +175,69 @@ class TestTOTP(object):
             "&period=30")
 
 
+@pytest.mark.requires_backend_interface(interface=HMACBackend)
+class TestVerifyMany(object):
+    def test_verify_many(self, backend):
+        secret = b"12345678901234567890"
+        other = b"09876543210987654321"
+        time = 1111111109
+
+        sha1 = TOTP(secret, 8, hashes.SHA1(), 30, backend)
+        sha256 = TOTP(secret, 6, hashes.SHA256(), 30, backend)
+        items = [
+            (secret, sha1.generate(time), 8, hashes.SHA1()),
+            (secret, sha256.generate(time - 30), 6, hashes.SHA256()),
+            (secret, b"12345678", 8, hashes.SHA1()),
+            (other, sha1.generate(time), 8, hashes.SHA1()),
+        ]
+
+        assert verify_many(items, time, backend) == [
+            time // 30, None, None, None
+        ]
+        assert verify_many(items, time, backend, window=1, workers=2) == [
+            time // 30, time // 30 - 1, None, None
+        ]
+
+    def test_time_step(self, backend):
+        secret = b"12345678901234567890"
+        totp = TOTP(secret, 8, hashes.SHA1(), 60, backend)
+        items = [(secret, totp.generate(119), 8, hashes.SHA1())]
+
+        assert verify_many(items, 119, backend, time_step=60) == [1]
+        assert verify_many(items, 119, backend) == [None]
+
+    def test_empty(self, backend):
+        assert verify_many([], 59, backend) == []
+
+    def test_invalid_items(self, backend):
+        secret = b"12345678901234567890"
+        totp = TOTP(secret, 6, hashes.SHA1(), 30, backend)
+        token = totp.generate(59)
+        items = [
+            (secret, token, 6, hashes.SHA1()),
+            (b"short", token, 6, hashes.SHA1()),
+            (secret, token, 5, hashes.SHA1()),
+            (secret, token, 6.0, hashes.SHA1()),
+            (secret, token, 6, hashes.MD5()),
+            (secret, token.decode(), 6, hashes.SHA1()),
+            (secret, token, 6, hashes.SHA1()),
+        ]
+
+        assert verify_many(items, 59, backend) == [
+            1, None, None, None, None, None, 1
+        ]
+        assert verify_many(items, 59, backend, workers=2) == [
+            1, None, None, None, None, None, 1
+        ]
+
+    def test_invalid_window(self, backend):
+        with pytest.raises(ValueError):
+            verify_many([], 59, backend, window=-1)
+
+        with pytest.raises(TypeError):
+            verify_many([], 59, backend, window=1.5)
+
+
 def test_invalid_backend():
     secret = b"12345678901234567890"
 
@@ -147,3 +245,6 @@ def test_invalid_backend():
 
     with raises_unsupported_algorithm(_Reasons.BACKEND_MISSING_INTERFACE):
         TOTP(secret, 8, hashes.SHA1(), 30, pretend_backend)
+
+    with raises_unsupported_algorithm(_Reasons.BACKEND_MISSING_INTERFACE):
+        verify_many([], 59, pretend_backend)
@@ -0,0 +1,62 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import pytest
+
+from cryptography import utils
+
+
+class TestParallelMap(object):
+    def test_serial(self):
+        assert utils._parallel_map(lambda x: x * 2, [1, 2, 3]) == [2, 4, 6]
+
+    @pytest.mark.parametrize("workers", [2, 4])
+    def test_threads_preserve_order(self, workers):
+        items = list(range(100))
+        assert utils._parallel_map(
+            lambda x: x * 2, items, workers=workers
+        ) == [x * 2 for x in items]
+
+    def test_bounded_queue(self):
+        items = list(range(100))
+        assert utils._parallel_map(
+            lambda x: x + 1, iter(items), workers=3, max_pending=2
+        ) == [x + 1 for x in items]
+
+    def test_empty(self):
+        assert utils._parallel_map(lambda x: x, [], workers=2) == []
+
+    def test_reraises(self):
+        def func(x):
+            if x == 5:
+                raise ValueError(x)
+            return x
+
+        with pytest.raises(ValueError):
+            utils._parallel_map(func, range(10), workers=2)
+
+    def test_shared_threads(self):
+        def nested(x):
+            return sum(utils._parallel_map(lambda y: y, range(x), workers=4))
+
+        threads = []
+        results = []
+        for _ in range(8):
+            thread = threading.Thread(
+                target=lambda: results.append(
+                    utils._parallel_map(nested, range(20), workers=4)
+                )
+            )
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        assert results == [[sum(range(x)) for x in range(20)]] * 8
+        assert len(utils._worker_pool._threads) <= utils._worker_pool._size
@@ -8,6 +8,7 @@ import pytest
 
 import six
 
+from cryptography import utils
 from cryptography.utils import InterfaceNotImplemented, verify_interface
 
 
@@ -52,3 +53,33 @@ class TestVerifyInterface(object):
                 """A concrete property"""
 
         verify_interface(SimpleInterface, NonImplementer)
+
+
+class TestRegisterInterface(object):
+    def test_register_verifies(self):
+        @six.add_metaclass(abc.ABCMeta)
+        class SimpleInterface(object):
+            @abc.abstractmethod
+            def method(self):
+                """A simple method"""
+
+        class NonImplementer(object):
+            pass
+
+        with pytest.raises(InterfaceNotImplemented):
+            utils.register_interface(SimpleInterface)(NonImplementer)
+
+    def test_register_skips_verification(self, monkeypatch):
+        monkeypatch.setattr(utils, "_verify_interfaces", False)
+
+        @six.add_metaclass(abc.ABCMeta)
+        class SimpleInterface(object):
+            @abc.abstractmethod
+            def method(self):
+                """A simple method"""
+
+        class NonImplementer(object):
+            pass
+
+        utils.register_interface(SimpleInterface)(NonImplementer)
+        assert issubclass(NonImplementer, SimpleInterface)